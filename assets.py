@@ -5,12 +5,184 @@ import os
 import math
 import pygame
 from settings import *
+from functools import lru_cache, partial
 from utils import load_image, load_sound, color_lerp
 
+# Hexagon placeholder vertices (computed once at import)
+_HEX_POINTS = [(50 + 40 * math.cos(i * math.tau / 6), 50 + 40 * math.sin(i * math.tau / 6)) for i in range(6)]
+
+# Object placeholder geometry: shape -> (pygame.draw primitive, arguments) on a 100x100 surface
+_SHAPES = {
+    "circle": ("circle", ((50, 50), 40)),
+    "square": ("rect", ((10, 10, 80, 80),)),
+    "triangle": ("polygon", ([(50, 10), (10, 90), (90, 90)],)),
+    "diamond": ("polygon", ([(50, 10), (90, 50), (50, 90), (10, 50)],)),
+    "hexagon": ("polygon", (_HEX_POINTS,))
+}
+
+# Icon placeholders: name -> [(pygame.draw primitive, color, arguments), ...] on a 32x32 surface
+_ICONS = {
+    "clock": [
+        ("circle", WHITE, ((16, 16), 15, 2)),
+        ("line", WHITE, ((16, 16), (16, 8), 2)),
+        ("line", WHITE, ((16, 16), (22, 16), 2))
+    ],
+    "info": [
+        ("circle", WHITE, ((16, 16), 15, 2)),
+        ("line", WHITE, ((16, 10), (16, 10), 3)),
+        ("line", WHITE, ((16, 14), (16, 22), 2))
+    ],
+    "check": [
+        ("polygon", GREEN, ([(8, 16), (14, 22), (24, 10), (22, 8), (14, 18), (10, 14)],))
+    ],
+    "cross": [
+        ("line", RED, ((8, 8), (24, 24), 3)),
+        ("line", RED, ((24, 8), (8, 24), 3))
+    ],
+    "lock": [
+        ("rect", WHITE, ((8, 14, 16, 14), 2, 2)),  # width 2, border_radius 2
+        ("arc", WHITE, ((8, 4, 16, 20), 3.14, 0, 2))
+    ],
+    "key": [
+        ("circle", YELLOW, ((10, 16), 6, 2)),
+        ("line", YELLOW, ((16, 16), (26, 16), 2)),
+        ("line", YELLOW, ((22, 12), (22, 20), 2)),
+        ("line", YELLOW, ((26, 12), (26, 20), 2))
+    ]
+}
+
+@lru_cache(maxsize=None)
+def _get_room_grid_template():
+    """
+    Get the grayscale grid template shared by all room placeholders.
+
+    The template is white with grid lines at 80% brightness, so multiplying
+    it over a solid color darkens only the lines (same as lerping 20% to black).
+
+    Returns:
+        Pygame Surface
+    """
+    template = pygame.Surface((ROOM_WIDTH, ROOM_HEIGHT))
+    template.fill(WHITE)
+
+    grid_size = 50
+    line_color = color_lerp(WHITE, BLACK, 0.2)
+    for x in range(0, ROOM_WIDTH, grid_size):
+        pygame.draw.line(template, line_color, (x, 0), (x, ROOM_HEIGHT))
+    for y in range(0, ROOM_HEIGHT, grid_size):
+        pygame.draw.line(template, line_color, (0, y), (ROOM_WIDTH, y))
+
+    return template
+
+def _build_room_placeholder(color):
+    """
+    Build a room background placeholder.
+
+    Args:
+        color: Base room color
+
+    Returns:
+        Pygame Surface
+    """
+    room_surface = pygame.Surface((ROOM_WIDTH, ROOM_HEIGHT))
+    room_surface.fill(color)
+
+    # Add grid pattern (tint the shared template instead of redrawing the lines)
+    room_surface.blit(_get_room_grid_template(), (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+
+    # Add border
+    pygame.draw.rect(room_surface, color_lerp(color, WHITE, 0.3), (0, 0, ROOM_WIDTH, ROOM_HEIGHT), ROOM_BORDER_WIDTH)
+
+    return room_surface
+
+@lru_cache(maxsize=None)
+def _get_shape_outline(shape):
+    """
+    Get the white outline of a shape on a transparent surface.
+
+    The outline is the same for every color, so it is rasterized once per shape.
+
+    Args:
+        shape: Shape name (key of _SHAPES)
+
+    Returns:
+        Pygame Surface
+    """
+    outline = pygame.Surface((100, 100), pygame.SRCALPHA)
+    primitive, args = _SHAPES[shape]
+    getattr(pygame.draw, primitive)(outline, WHITE, *args, 2)
+    return outline
+
+def _build_object_placeholder(shape, color):
+    """
+    Build an object placeholder.
+
+    Args:
+        shape: Shape name ("circle", "square", "triangle", "diamond", "hexagon")
+        color: Fill color
+
+    Returns:
+        Pygame Surface
+    """
+    obj_surface = pygame.Surface((100, 100), pygame.SRCALPHA)
+
+    # Filled shape plus the shared 2px white outline
+    primitive, args = _SHAPES[shape]
+    getattr(pygame.draw, primitive)(obj_surface, color, *args)
+    obj_surface.blit(_get_shape_outline(shape), (0, 0))
+
+    return obj_surface
+
+def _build_button_placeholder(color):
+    """
+    Build a button placeholder.
+
+    Args:
+        color: Button background color
+
+    Returns:
+        Pygame Surface
+    """
+    button_surface = pygame.Surface((UI_BUTTON_WIDTH, UI_BUTTON_HEIGHT), pygame.SRCALPHA)
+    pygame.draw.rect(button_surface, color, (0, 0, UI_BUTTON_WIDTH, UI_BUTTON_HEIGHT), border_radius=UI_BUTTON_RADIUS)
+    pygame.draw.rect(button_surface, WHITE, (0, 0, UI_BUTTON_WIDTH, UI_BUTTON_HEIGHT), 2, border_radius=UI_BUTTON_RADIUS)
+    return button_surface
+
+def _build_panel_placeholder():
+    """
+    Build a panel placeholder.
+
+    Returns:
+        Pygame Surface
+    """
+    panel_surface = pygame.Surface((400, 300), pygame.SRCALPHA)
+    pygame.draw.rect(panel_surface, (*CHARCOAL, 220), (0, 0, 400, 300), border_radius=10)
+    pygame.draw.rect(panel_surface, WHITE, (0, 0, 400, 300), 2, border_radius=10)
+    return panel_surface
+
+def _build_icon_placeholder(name):
+    """
+    Build an icon placeholder.
+
+    Args:
+        name: Icon name (key of _ICONS)
+
+    Returns:
+        Pygame Surface
+    """
+    icon_surface = pygame.Surface((32, 32), pygame.SRCALPHA)
+
+    for primitive, color, args in _ICONS[name]:
+        getattr(pygame.draw, primitive)(icon_surface, color, *args)
+
+    return icon_surface
+
 class AssetManager:
     """
     Manages game assets (images, sounds, fonts).
     """
+    __slots__ = ("images", "sounds", "fonts", "animations", "_image_factories", "initialized")
+
     def __init__(self):
         """
         Initialize the asset manager.
@@ -19,6 +191,7 @@ class AssetManager:
         self.sounds = {}
         self.fonts = {}
         self.animations = {}
+        self._image_factories = {}  # name -> callable that builds a placeholder image
         self.initialized = False
 
         # Initialize pygame font module
@@ -51,7 +224,7 @@ class AssetManager:
         # Cargar la imagen de fondo para todas las pantallas
         try:
             # Cargar la imagen original
-            original_bg = load_image("img/fondo.png", None, True)
+            original_bg = load_image("img/fondo.png", None, False)  # Fondo opaco, sin canal alfa
             if original_bg is None:
                 raise ValueError("No se pudo cargar la imagen de fondo")
 
@@ -61,24 +234,32 @@ class AssetManager:
             new_width = int(bg_width * scale_factor)
             new_height = int(bg_height * scale_factor)
 
-            # Crear una superficie del tamaño de la ventana
-            background_image = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-            background_image.fill(BLACK)  # Fondo negro para las áreas no cubiertas
-
             # Escalar la imagen original
             scaled_bg = pygame.transform.scale(original_bg, (new_width, new_height))
 
-            # Centrar la imagen en la ventana
-            x_offset = (WINDOW_WIDTH - new_width) // 2
-            y_offset = (WINDOW_HEIGHT - new_height) // 2
-            background_image.blit(scaled_bg, (x_offset, y_offset))
+            if new_width == WINDOW_WIDTH and new_height == WINDOW_HEIGHT:
+                # La imagen ya cubre toda la ventana: no hace falta centrarla
+                background_image = scaled_bg
+            else:
+                # Crear una superficie del tamaño de la ventana
+                background_image = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+                background_image.fill(BLACK)  # Fondo negro para las áreas no cubiertas
+
+                # Centrar la imagen en la ventana
+                x_offset = (WINDOW_WIDTH - new_width) // 2
+                y_offset = (WINDOW_HEIGHT - new_height) // 2
+                background_image.blit(scaled_bg, (x_offset, y_offset))
 
             # Guardar la imagen de fondo como un recurso común para todas las pantallas
-            self.images["common_background"] = background_image
+            # (en el formato de la pantalla para que los blits sean directos)
+            self.images["common_background"] = background_image.convert()
             print("Imagen de fondo cargada y escalada correctamente para todas las pantallas")
         except Exception as e:
             print(f"Error al cargar la imagen de fondo: {e}")
 
+        # Cargar el fondo del menú principal ya escalado a la ventana (opaco)
+        self.images["menu_background"] = load_image("img/remix_2.png", (WINDOW_WIDTH, WINDOW_HEIGHT), False)
+
         # Cargar el sprite sheet del personaje (mono con traje) sin animación hacia abajo
         sprite_sheet = load_image("img/mono_traje.png", None, True)
         if sprite_sheet is None:
@@ -88,39 +269,30 @@ class AssetManager:
         sheet_height = sprite_sheet.get_height()
         frame_width = sheet_width // 3  # 3 columnas
         frame_height = sheet_height // 2  # 2 filas
-        self.animations["player_down"] = []
+        self.animations["player_down"] = ()
         # Usar el primer frame como imagen estática del jugador
-        frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-        frame.fill((0, 0, 0, 0))
-        frame.blit(sprite_sheet, (0, 0), (0, 0, frame_width, frame_height))
+        frame = sprite_sheet.subsurface((0, 0, frame_width, frame_height)).copy()
         frame = pygame.transform.scale(frame, (PLAYER_WIDTH, PLAYER_HEIGHT))
         self.images["player"] = frame
 
-        # Cargar el sprite sheet original para las otras direcciones
-        sprite_sheet = load_image("img/mono_traje.png", None, True)
-        if sprite_sheet is None:
-            raise ValueError("No se pudo cargar el sprite sheet del personaje para otras direcciones")
-        sheet_width = sprite_sheet.get_width()
-        sheet_height = sprite_sheet.get_height()
-        frame_width = sheet_width // 3
-        frame_height = sheet_height // 2
-        self.animations["player_up"] = []
+        # Reutilizar el mismo sprite sheet para las otras direcciones
+        # (las animaciones se guardan como tuplas: no cambian después de cargarse)
+        up_frames = []
         for i in range(1, 3):
-            back_frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-            back_frame.fill((0, 0, 0, 0))
-            back_frame.blit(sprite_sheet, (0, 0), (i * frame_width, 0, frame_width, frame_height))
+            back_frame = sprite_sheet.subsurface((i * frame_width, 0, frame_width, frame_height)).copy()
             back_frame = pygame.transform.scale(back_frame, (PLAYER_WIDTH, PLAYER_HEIGHT))
-            self.animations["player_up"].append(back_frame)
-        self.animations["player_left"] = []
-        self.animations["player_right"] = []
+            up_frames.append(back_frame)
+        self.animations["player_up"] = tuple(up_frames)
+        left_frames = []
+        right_frames = []
         for i in range(3):
-            left_frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-            left_frame.fill((0, 0, 0, 0))
-            left_frame.blit(sprite_sheet, (0, 0), (i * frame_width, frame_height, frame_width, frame_height))
+            left_frame = sprite_sheet.subsurface((i * frame_width, frame_height, frame_width, frame_height)).copy()
             left_frame = pygame.transform.scale(left_frame, (PLAYER_WIDTH, PLAYER_HEIGHT))
-            self.animations["player_left"].append(left_frame)
+            left_frames.append(left_frame)
             right_frame = pygame.transform.flip(left_frame, True, False)
-            self.animations["player_right"].append(right_frame)
+            right_frames.append(right_frame)
+        self.animations["player_left"] = tuple(left_frames)
+        self.animations["player_right"] = tuple(right_frames)
         print("Sprite sheets del personaje cargados y divididos correctamente")
 
     def initialize_fonts(self):
@@ -134,16 +306,25 @@ class AssetManager:
         """
         Load default system fonts.
         """
-        self.fonts["large"] = pygame.font.SysFont("Arial", UI_FONT_SIZE_LARGE)
-        self.fonts["medium"] = pygame.font.SysFont("Arial", UI_FONT_SIZE_MEDIUM)
-        self.fonts["small"] = pygame.font.SysFont("Arial", UI_FONT_SIZE_SMALL)
-        self.fonts["tiny"] = pygame.font.SysFont("Arial", UI_FONT_SIZE_TINY)
-
-        # Bold variants
-        self.fonts["large_bold"] = pygame.font.SysFont("Arial", UI_FONT_SIZE_LARGE, bold=True)
-        self.fonts["medium_bold"] = pygame.font.SysFont("Arial", UI_FONT_SIZE_MEDIUM, bold=True)
-        self.fonts["small_bold"] = pygame.font.SysFont("Arial", UI_FONT_SIZE_SMALL, bold=True)
-        self.fonts["tiny_bold"] = pygame.font.SysFont("Arial", UI_FONT_SIZE_TINY, bold=True)
+        # Resolve the Arial files once instead of scanning the system fonts per size
+        regular_path = pygame.font.match_font("Arial")
+        bold_path = pygame.font.match_font("Arial", bold=True)
+
+        sizes = [
+            ("large", UI_FONT_SIZE_LARGE),
+            ("medium", UI_FONT_SIZE_MEDIUM),
+            ("small", UI_FONT_SIZE_SMALL),
+            ("tiny", UI_FONT_SIZE_TINY)
+        ]
+        for key, size in sizes:
+            # A None path falls back to pygame's default font, like SysFont does
+            self.fonts[key] = pygame.font.Font(regular_path, size)
+
+            # Bold variants (synthetic bold if there is no bold face, like SysFont)
+            bold_font = pygame.font.Font(bold_path or regular_path, size)
+            if bold_path is None or bold_path == regular_path:
+                bold_font.set_bold(True)
+            self.fonts[f"{key}_bold"] = bold_font
 
     def _load_fonts(self):
         """
@@ -155,16 +336,19 @@ class AssetManager:
 
     def create_placeholder_images(self):
         """
-        Create placeholder images for development.
+        Register placeholder images for development.
+
+        Only the player placeholder is created right away; the rest are
+        built lazily by get_image() the first time they are requested.
         """
         # Player placeholder (solo si no se cargó la imagen real)
         if "player" not in self.images:
             player_surface = pygame.Surface((PLAYER_WIDTH, PLAYER_HEIGHT), pygame.SRCALPHA)
             pygame.draw.circle(player_surface, BLUE, (PLAYER_WIDTH // 2, PLAYER_HEIGHT // 2), PLAYER_WIDTH // 2)
             pygame.draw.circle(player_surface, WHITE, (PLAYER_WIDTH // 2, PLAYER_HEIGHT // 2), PLAYER_WIDTH // 2, 2)
-            self.images["player"] = player_surface
+            self.images["player"] = player_surface.convert_alpha()
 
-        # Room background placeholders
+        # Room background placeholders (built the first time they are requested)
         for color_name, color in [
             ("gray", GRAY),
             ("blue", LIGHT_BLUE),
@@ -175,23 +359,10 @@ class AssetManager:
             ("cyan", CYAN),
             ("orange", ORANGE)
         ]:
-            room_surface = pygame.Surface((ROOM_WIDTH, ROOM_HEIGHT))
-            room_surface.fill(color)
-
-            # Add grid pattern
-            grid_size = 50
-            for x in range(0, ROOM_WIDTH, grid_size):
-                pygame.draw.line(room_surface, (*color_lerp(color, BLACK, 0.2), 128), (x, 0), (x, ROOM_HEIGHT))
-            for y in range(0, ROOM_HEIGHT, grid_size):
-                pygame.draw.line(room_surface, (*color_lerp(color, BLACK, 0.2), 128), (0, y), (ROOM_WIDTH, y))
-
-            # Add border
-            pygame.draw.rect(room_surface, color_lerp(color, WHITE, 0.3), (0, 0, ROOM_WIDTH, ROOM_HEIGHT), ROOM_BORDER_WIDTH)
-
-            self.images[f"room_{color_name}"] = room_surface
+            self._image_factories[f"room_{color_name}"] = partial(_build_room_placeholder, color)
 
         # Object placeholders
-        for shape in ["circle", "square", "triangle", "diamond", "hexagon"]:
+        for shape in _SHAPES:
             for color_name, color in [
                 ("red", RED),
                 ("green", GREEN),
@@ -202,88 +373,16 @@ class AssetManager:
                 ("orange", ORANGE),
                 ("white", WHITE)
             ]:
-                obj_surface = pygame.Surface((100, 100), pygame.SRCALPHA)
-
-                if shape == "circle":
-                    pygame.draw.circle(obj_surface, color, (50, 50), 40)
-                    pygame.draw.circle(obj_surface, WHITE, (50, 50), 40, 2)
-                elif shape == "square":
-                    pygame.draw.rect(obj_surface, color, (10, 10, 80, 80))
-                    pygame.draw.rect(obj_surface, WHITE, (10, 10, 80, 80), 2)
-                elif shape == "triangle":
-                    pygame.draw.polygon(obj_surface, color, [(50, 10), (10, 90), (90, 90)])
-                    pygame.draw.polygon(obj_surface, WHITE, [(50, 10), (10, 90), (90, 90)], 2)
-                elif shape == "diamond":
-                    pygame.draw.polygon(obj_surface, color, [(50, 10), (90, 50), (50, 90), (10, 50)])
-                    pygame.draw.polygon(obj_surface, WHITE, [(50, 10), (90, 50), (50, 90), (10, 50)], 2)
-                elif shape == "hexagon":
-                    points = []
-                    for i in range(6):
-                        angle = i * (2 * 3.14159 / 6)
-                        points.append((50 + 40 * math.cos(angle), 50 + 40 * math.sin(angle)))
-                    pygame.draw.polygon(obj_surface, color, points)
-                    pygame.draw.polygon(obj_surface, WHITE, points, 2)
-
-                self.images[f"object_{shape}_{color_name}"] = obj_surface
+                self._image_factories[f"object_{shape}_{color_name}"] = partial(_build_object_placeholder, shape, color)
 
         # UI elements
-        # Button
-        button_surface = pygame.Surface((UI_BUTTON_WIDTH, UI_BUTTON_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.rect(button_surface, CHARCOAL, (0, 0, UI_BUTTON_WIDTH, UI_BUTTON_HEIGHT), border_radius=UI_BUTTON_RADIUS)
-        pygame.draw.rect(button_surface, WHITE, (0, 0, UI_BUTTON_WIDTH, UI_BUTTON_HEIGHT), 2, border_radius=UI_BUTTON_RADIUS)
-        self.images["button"] = button_surface
-
-        # Button hover
-        button_hover_surface = pygame.Surface((UI_BUTTON_WIDTH, UI_BUTTON_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.rect(button_hover_surface, color_lerp(CHARCOAL, WHITE, 0.3), (0, 0, UI_BUTTON_WIDTH, UI_BUTTON_HEIGHT), border_radius=UI_BUTTON_RADIUS)
-        pygame.draw.rect(button_hover_surface, WHITE, (0, 0, UI_BUTTON_WIDTH, UI_BUTTON_HEIGHT), 2, border_radius=UI_BUTTON_RADIUS)
-        self.images["button_hover"] = button_hover_surface
-
-        # Panel
-        panel_surface = pygame.Surface((400, 300), pygame.SRCALPHA)
-        pygame.draw.rect(panel_surface, (*CHARCOAL, 220), (0, 0, 400, 300), border_radius=10)
-        pygame.draw.rect(panel_surface, WHITE, (0, 0, 400, 300), 2, border_radius=10)
-        self.images["panel"] = panel_surface
+        self._image_factories["button"] = partial(_build_button_placeholder, CHARCOAL)
+        self._image_factories["button_hover"] = partial(_build_button_placeholder, color_lerp(CHARCOAL, WHITE, 0.3))
+        self._image_factories["panel"] = _build_panel_placeholder
 
         # Icons
-        # Clock icon
-        clock_surface = pygame.Surface((32, 32), pygame.SRCALPHA)
-        pygame.draw.circle(clock_surface, WHITE, (16, 16), 15, 2)
-        pygame.draw.line(clock_surface, WHITE, (16, 16), (16, 8), 2)
-        pygame.draw.line(clock_surface, WHITE, (16, 16), (22, 16), 2)
-        self.images["icon_clock"] = clock_surface
-
-        # Info icon
-        info_surface = pygame.Surface((32, 32), pygame.SRCALPHA)
-        pygame.draw.circle(info_surface, WHITE, (16, 16), 15, 2)
-        pygame.draw.line(info_surface, WHITE, (16, 10), (16, 10), 3)
-        pygame.draw.line(info_surface, WHITE, (16, 14), (16, 22), 2)
-        self.images["icon_info"] = info_surface
-
-        # Check icon
-        check_surface = pygame.Surface((32, 32), pygame.SRCALPHA)
-        pygame.draw.polygon(check_surface, GREEN, [(8, 16), (14, 22), (24, 10), (22, 8), (14, 18), (10, 14)])
-        self.images["icon_check"] = check_surface
-
-        # Cross icon
-        cross_surface = pygame.Surface((32, 32), pygame.SRCALPHA)
-        pygame.draw.line(cross_surface, RED, (8, 8), (24, 24), 3)
-        pygame.draw.line(cross_surface, RED, (24, 8), (8, 24), 3)
-        self.images["icon_cross"] = cross_surface
-
-        # Lock icon
-        lock_surface = pygame.Surface((32, 32), pygame.SRCALPHA)
-        pygame.draw.rect(lock_surface, WHITE, (8, 14, 16, 14), 2, border_radius=2)
-        pygame.draw.arc(lock_surface, WHITE, (8, 4, 16, 20), 3.14, 0, 2)
-        self.images["icon_lock"] = lock_surface
-
-        # Key icon
-        key_surface = pygame.Surface((32, 32), pygame.SRCALPHA)
-        pygame.draw.circle(key_surface, YELLOW, (10, 16), 6, 2)
-        pygame.draw.line(key_surface, YELLOW, (16, 16), (26, 16), 2)
-        pygame.draw.line(key_surface, YELLOW, (22, 12), (22, 20), 2)
-        pygame.draw.line(key_surface, YELLOW, (26, 12), (26, 20), 2)
-        self.images["icon_key"] = key_surface
+        for icon_name in _ICONS:
+            self._image_factories[f"icon_{icon_name}"] = partial(_build_icon_placeholder, icon_name)
 
     def load_image(self, name, path, scale=None, alpha=True):
         """
@@ -335,12 +434,15 @@ class AssetManager:
             alpha: Whether the frames have transparency
         """
         frames = []
+        loaded = {}  # path -> frame, so repeated paths are decoded only once
         for i in range(frame_count):
             path = path_pattern.format(i)
-            frame = load_image(path, scale, alpha)
+            frame = loaded.get(path)
+            if frame is None:
+                frame = loaded[path] = load_image(path, scale, alpha)
             frames.append(frame)
 
-        self.animations[name] = frames
+        self.animations[name] = tuple(frames)
 
     def get_image(self, name):
         """
@@ -352,11 +454,25 @@ class AssetManager:
         Returns:
             Pygame Surface
         """
-        if name in self.images:
+        try:
             return self.images[name]
-        else:
-            print(f"Warning: Image '{name}' not found")
-            return self.images.get("player", pygame.Surface((32, 32)))
+        except KeyError:
+            pass
+
+        # Build placeholder images on first use
+        factory = self._image_factories.pop(name, None)
+        if factory is not None:
+            image = factory()
+            # Match the display pixel format so later blits skip the conversion
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha() if image.get_flags() & pygame.SRCALPHA else image.convert()
+            self.images[name] = image
+            return image
+
+        print(f"Warning: Image '{name}' not found")
+        if "player" in self.images:
+            return self.images["player"]
+        return pygame.Surface((32, 32))
 
     def get_sound(self, name):
         """
@@ -380,7 +496,10 @@ class AssetManager:
         Returns:
             Pygame Font object
         """
-        return self.fonts.get(name, self.fonts["medium"])
+        try:
+            return self.fonts[name]
+        except KeyError:
+            return self.fonts["medium"]
 
     def get_animation(self, name):
         """
@@ -390,9 +509,12 @@ class AssetManager:
             name: Animation name
 
         Returns:
-            List of Pygame Surfaces
+            Tuple of Pygame Surfaces
         """
-        return self.animations.get(name, [])
+        try:
+            return self.animations[name]
+        except KeyError:
+            return ()
 
 # Global asset manager instance
 assets = AssetManager()
@@ -1,7 +1,6 @@
 """
 Game state management for the Escape Room game.
 """
-import sys
 import pygame
 import random
 import math
@@ -13,6 +12,36 @@ from timer import Timer
 from assets import assets
 from utils import draw_decorative_border, draw_stardew_button, draw_stardew_title, color_lerp
 
+# Salas desde las que se avanza a la siguiente sala con ESPACIO en el área de transición
+_ADVANCE_ROOMS = frozenset((
+    ScrumRolesRoom,
+    ScrumArtifactsRoom,
+    PMBOKInitiationRoom,
+    PMBOKPlanningRoom,
+    PMBOKExecutionRoom
+))
+
+# Posición de entrada del jugador según la sala de destino: clase -> (x, y)
+_ENTRY_XY = {
+    ScrumArtifactsRoom: (WINDOW_WIDTH - PLAYER_WIDTH - 20, WINDOW_HEIGHT - PLAYER_HEIGHT - 20),  # Esquina inferior derecha
+    PMBOKPlanningRoom: (WINDOW_WIDTH // 2, WINDOW_HEIGHT - PLAYER_HEIGHT - 50),  # 50 píxeles desde el borde inferior
+    PMBOKExecutionRoom: (WINDOW_WIDTH // 2, WINDOW_HEIGHT - PLAYER_HEIGHT - 50),
+    PMBOKClosingRoom: (WINDOW_WIDTH // 2, WINDOW_HEIGHT - PLAYER_HEIGHT - 50)
+}
+_DEFAULT_ENTRY_XY = (WINDOW_WIDTH // 2, WINDOW_HEIGHT - 100)  # Salas sin posición específica (Sala 3 de SCRUM)
+
+# Estados que solo reaccionan a pulsaciones de teclas
+_KEYDOWN_ONLY_STATES = frozenset((STATE_MENU, STATE_INSTRUCTIONS, STATE_GAME_OVER, STATE_VICTORY))
+
+# Estados cuya pantalla no cambia mientras se permanece en ellos
+_STATIC_STATES = frozenset((STATE_MENU, STATE_INSTRUCTIONS, STATE_GAME_OVER, STATE_VICTORY))
+
+# Eventos de ventana tras los que hay que volver a dibujar la pantalla completa
+_REDRAW_EVENTS = frozenset((pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.VIDEOEXPOSE))
+
+# Estados cuyo fondo cubre toda la ventana (no hace falta limpiar la pantalla antes)
+_FULL_COVER_STATES = frozenset((STATE_MENU, STATE_PATH_SELECTION, STATE_GAME))
+
 class Game:
     """
     Main game class that manages game states and components.
@@ -26,11 +55,14 @@ class Game:
         """
         self.screen = screen
         self.state = STATE_MENU
+        self.running = True  # El bucle principal termina cuando pasa a False
+        self._rendered_state = None  # Estado dibujado en el último frame
         self.selected_path = None
 
         # Initialize components
         self.ui = UI(self)
         self.player = None
+        self.path_selection_player = None  # Jugador de la pantalla de selección de camino
         self.room_manager = None
         self.timer = None
 
@@ -40,10 +72,112 @@ class Game:
         self.completed_rooms = 0
         self.time_bonus = 0
 
-        # Load fonts
+        # Load fonts (the 36 and 24 point Stardew fonts are already loaded by the asset manager)
         self.font_large = pygame.font.Font("assets/fonts/Stardew_Valley.ttf", 48)
-        self.font_medium = pygame.font.Font("assets/fonts/Stardew_Valley.ttf", 36)
-        self.font_small = pygame.font.Font("assets/fonts/Stardew_Valley.ttf", 24)
+        self.font_medium = assets.get_font("stardew_medium")
+        self.font_small = assets.get_font("stardew_small")
+
+        # Métodos por estado (evita la cadena de if/elif en cada llamada)
+        self._event_handlers = {
+            STATE_MENU: self._handle_menu_event,
+            STATE_PATH_SELECTION: self._handle_path_selection_event,
+            STATE_INSTRUCTIONS: self._handle_instructions_event,
+            STATE_GAME: self._handle_game_event,
+            STATE_GAME_OVER: self._handle_end_event,
+            STATE_VICTORY: self._handle_end_event
+        }
+        self._update_handlers = {
+            STATE_PATH_SELECTION: self._update_path_selection,
+            STATE_GAME: self._update_game
+        }
+        self._render_handlers = {
+            STATE_MENU: self._render_menu,
+            STATE_PATH_SELECTION: self._render_path_selection,
+            STATE_INSTRUCTIONS: self._render_instructions,
+            STATE_GAME: self._render_game,
+            STATE_GAME_OVER: self._render_game_over,
+            STATE_VICTORY: self._render_victory
+        }
+
+        # Fondo del menú (imagen, borde, títulos, botones, destellos y versión) compuesto una sola vez
+        self._menu_background = self._build_menu_background().convert()
+
+        # Geometría fija de las pantallas de fin de juego
+        self._game_over_panel_rect = pygame.Rect(0, 0, 600, 400)
+        self._game_over_panel_rect.center = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)
+        self._victory_panel_rect = pygame.Rect(0, 0, 700, 500)
+        self._victory_panel_rect.center = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)
+
+        # Textos fijos de la pantalla de instrucciones: [(surface, rect), ...]
+        self._instructions_texts = self._build_instructions_texts()
+
+        # Paneles de fin de juego con sus textos fijos ya dibujados
+        self._game_over_panel = self._build_end_panel(self._game_over_panel_rect, RED, [
+            (self.font_large, "Game Over", RED, 50),
+            (self.font_medium, "Time's up! You couldn't escape in time.", WHITE, 120),
+            (self.font_medium, "Press ENTER to return to menu", WHITE, 320),
+            (self.font_small, "Press ESC to exit", WHITE, 360)
+        ])
+        self._victory_panel = self._build_end_panel(self._victory_panel_rect, GREEN, [
+            (self.font_large, "Victory!", GREEN, 50),
+            (self.font_medium, "Press ENTER to return to menu", WHITE, 400),
+            (self.font_small, "Press ESC to exit", WHITE, 440)
+        ])
+
+        # Panel completo (fondo, textos fijos y puntuación) de la pantalla de fin actual:
+        # se compone al entrar y cuando cambian las puntuaciones
+        self._end_screen_key = None
+        self._end_screen = None
+
+    def _build_end_panel(self, panel_rect, border_color, labels):
+        """
+        Build the static part of an end screen panel.
+
+        Args:
+            panel_rect: Panel rectangle on screen
+            border_color: Panel border color
+            labels: List of (font, text, color, y offset from the panel top)
+
+        Returns:
+            Pygame Surface of the panel size, to be blitted at panel_rect
+        """
+        panel = pygame.Surface(panel_rect.size, pygame.SRCALPHA)
+        local_rect = panel.get_rect()
+        pygame.draw.rect(panel, CHARCOAL, local_rect, border_radius=15)
+        pygame.draw.rect(panel, border_color, local_rect, 3, border_radius=15)
+
+        center_x = WINDOW_WIDTH // 2 - panel_rect.x
+        for font, text, color, y_offset in labels:
+            text_surface = font.render(text, True, color)
+            panel.blit(text_surface, text_surface.get_rect(center=(center_x, y_offset)))
+
+        return panel.convert_alpha()
+
+    def _get_end_screen(self, panel, panel_rect, build_labels):
+        """
+        Get the fully composed panel of the current end screen.
+
+        The score lines are drawn onto a copy of the static panel when the screen
+        is entered, and the result is reused until the state or the scores change.
+
+        Args:
+            panel: Static panel Surface built by _build_end_panel
+            panel_rect: Panel rectangle on screen
+            build_labels: Method returning the score lines as a list of (font, text, color, y offset from the panel top)
+
+        Returns:
+            Pygame Surface of the panel size, to be blitted at panel_rect
+        """
+        key = (self.state, self.selected_path, self.total_score, self.high_score, self.completed_rooms, self.time_bonus)
+        if key != self._end_screen_key:
+            self._end_screen_key = key
+            screen_panel = panel.copy()
+            center_x = WINDOW_WIDTH // 2 - panel_rect.x
+            for font, text, color, y_offset in build_labels():
+                text_surface = font.render(text, True, color)
+                screen_panel.blit(text_surface, text_surface.get_rect(center=(center_x, y_offset)))
+            self._end_screen = screen_panel
+        return self._end_screen
 
     def handle_event(self, event):
         """
@@ -52,167 +186,126 @@ class Game:
         Args:
             event: Pygame event
         """
-        if self.state == STATE_MENU:
-            self._handle_menu_event(event)
-        elif self.state == STATE_PATH_SELECTION:
-            self._handle_path_selection_event(event)
-        elif self.state == STATE_INSTRUCTIONS:
-            self._handle_instructions_event(event)
-        elif self.state == STATE_GAME:
-            self._handle_game_event(event)
-        elif self.state == STATE_GAME_OVER or self.state == STATE_VICTORY:
-            self._handle_end_event(event)
+        # La ventana se ha vuelto a mostrar: SDL no la repinta, así que se redibuja el estado actual
+        if event.type in _REDRAW_EVENTS:
+            self._rendered_state = None
+            return
+
+        # Descartar pronto los eventos que no son de teclado en menús y pantallas finales
+        if event.type != pygame.KEYDOWN and self.state in _KEYDOWN_ONLY_STATES:
+            return
+
+        handler = self._event_handlers.get(self.state)
+        if handler is not None:
+            handler(event)
 
     def update(self):
         """
         Update game state and components.
         """
-        # Actualizar la pantalla de selección de camino
-        if self.state == STATE_PATH_SELECTION:
-            if hasattr(self, 'path_selection_player') and self.path_selection_player is not None:
-                self.path_selection_player.update()
-
-        # Actualizar el juego principal
-        elif self.state == STATE_GAME:
-            if not getattr(self.room_manager.get_current_room(), 'showing_info', False):
-                self.player.update()
-            current_room = self.room_manager.get_current_room()
-            self.player.current_room = current_room
-            current_room.update()
-            self.timer.update()
-            self.ui.update()
-
-            # Verificar si el jugador está cerca del área de la misión (solo para PMBOKInitiationRoom)
-           # if isinstance(current_room, PMBOKInitiationRoom):
-            #    if hasattr(current_room, 'check_mission_area'):
-             #       current_room.check_mission_area(self.player.rect)
-            if hasattr(current_room, 'check_mission_area'):
-                current_room.check_mission_area(self.player.rect)
-            if hasattr(current_room, 'check_info_area'):
-                 current_room.check_info_area(self.player.rect)
-
-            # Verificar si se ha presionado la tecla de espacio para interactuar
-            # Bloquear interacción si se está mostrando el recuadro informativo
-            if self.player.is_interacting() and not getattr(current_room, 'showing_info', False):
-
-                # Verificar si el jugador está en un área de transición
-                in_transition_area = False
-                if hasattr(current_room, 'check_transition_area'):
-                    in_transition_area = current_room.check_transition_area(self.player.rect)
-
-                # Si está en un área de transición y presiona espacio
-                if in_transition_area:
-                    # Si es la sala 1, 2 o 3 de SCRUM, o la sala 1, 2 o 3 de PMBOK, ir a la siguiente sala
-                    if (isinstance(current_room, ScrumRolesRoom) or
-                        isinstance(current_room, ScrumArtifactsRoom) or
-                        isinstance(current_room, PMBOKInitiationRoom) or
-                        isinstance(current_room, PMBOKPlanningRoom) or
-                        isinstance(current_room, PMBOKExecutionRoom)) and self.room_manager.has_next_room():
-                        # Incrementar contador de salas completadas
-                        self.completed_rooms += 1
-
-                        # Cambiar a la siguiente sala
-                        self.room_manager.go_to_next_room()
-                        current_room = self.room_manager.get_current_room()
-                        self.player.current_room = current_room
-
-                        # Posicionar al jugador según la sala de destino
-                        if isinstance(current_room, ScrumArtifactsRoom):  # Si va hacia la Sala 2 de SCRUM
-                            self.player.rect.x = WINDOW_WIDTH - self.player.width - 20  # 20 píxeles desde el borde derecho
-                            self.player.rect.y = WINDOW_HEIGHT - self.player.height - 20  # 20 píxeles desde el borde inferior
-                        elif isinstance(current_room, PMBOKPlanningRoom):  # Si va hacia la Sala 2 de PMBOK
-                            self.player.rect.x = WINDOW_WIDTH // 2
-                            self.player.rect.y = WINDOW_HEIGHT - self.player.height - 50  # 50 píxeles desde el borde inferior
-                        elif isinstance(current_room, PMBOKExecutionRoom):  # Si va hacia la Sala 3 de PMBOK
-                            self.player.rect.x = WINDOW_WIDTH // 2
-                            self.player.rect.y = WINDOW_HEIGHT - self.player.height - 50  # 50 píxeles desde el borde inferior
-                        elif isinstance(current_room, PMBOKClosingRoom):  # Si va hacia la Sala 4 de PMBOK
-                            self.player.rect.x = WINDOW_WIDTH // 2
-                            self.player.rect.y = WINDOW_HEIGHT - self.player.height - 50  # 50 píxeles desde el borde inferior
-                        else:  # Si va hacia la Sala 3 de SCRUM
-                            self.player.rect.x = WINDOW_WIDTH // 2
-                            self.player.rect.y = WINDOW_HEIGHT - 100
-
-                        # Actualizar también las coordenadas x e y del jugador para mantener consistencia
-                        self.player.x = self.player.rect.x
-                        self.player.y = self.player.rect.y
-
-                    # Si es la sala 4 de PMBOK o la sala 3 de SCRUM, finalizar el juego
-                    elif isinstance(current_room, PMBOKClosingRoom) or isinstance(current_room, ScrumEventsRoom):
-                        # Incrementar contador de salas completadas
-                        self.completed_rooms += 1
-
-                        # Calculate final score based on time left and rooms completed
-                        time_left = self.timer.get_time_left()
-                        self.time_bonus = int(time_left * 10)  # 10 points per second remaining
-                        self.total_score = (self.completed_rooms * 1000) + self.time_bonus  # 1000 points per room + time bonus
-                        self.high_score = max(self.high_score, self.total_score)
-                        self.state = STATE_VICTORY
-                        print("¡Juego completado! Victoria.")
-
-                        # Posicionar al jugador según la sala de destino
-                        if isinstance(current_room, ScrumArtifactsRoom):  # Si va hacia la Sala 2 de SCRUM
-                            self.player.rect.x = WINDOW_WIDTH - self.player.width - 20  # 20 píxeles desde el borde derecho
-                            self.player.rect.y = WINDOW_HEIGHT - self.player.height - 20  # 20 píxeles desde el borde inferior
-                        elif isinstance(current_room, PMBOKPlanningRoom):  # Si va hacia la Sala 2 de PMBOK
-                            self.player.rect.x = WINDOW_WIDTH // 2
-                            self.player.rect.y = WINDOW_HEIGHT - self.player.height - 50  # 50 píxeles desde el borde inferior
-                        elif isinstance(current_room, PMBOKExecutionRoom):  # Si va hacia la Sala 3 de PMBOK
-                            self.player.rect.x = WINDOW_WIDTH // 2
-                            self.player.rect.y = WINDOW_HEIGHT - self.player.height - 50  # 50 píxeles desde el borde inferior
-                        elif isinstance(current_room, PMBOKClosingRoom):  # Si va hacia la Sala 4 de PMBOK
-                            self.player.rect.x = WINDOW_WIDTH // 2
-                            self.player.rect.y = WINDOW_HEIGHT - self.player.height - 50  # 50 píxeles desde el borde inferior
-                        else:  # Si va hacia la Sala 3 de SCRUM
-                            self.player.rect.x = WINDOW_WIDTH // 2
-                            self.player.rect.y = WINDOW_HEIGHT - 100
-
-                        # Actualizar también las coordenadas x e y del jugador para mantener consistencia
-                        self.player.x = self.player.rect.x
-                        self.player.y = self.player.rect.y
-
-                        # Imprimir mensaje de depuración
-                        print(f"Transición a la siguiente sala: {current_room.__class__.__name__}")
-
-                    # Si es la última sala (ScrumEventsRoom), finalizar el juego
-                    elif isinstance(current_room, ScrumEventsRoom):
-                        # Incrementar contador de salas completadas
-                        self.completed_rooms += 1
-
-                        # Calculate final score based on time left and rooms completed
-                        time_left = self.timer.get_time_left()
-                        self.time_bonus = int(time_left * 10)  # 10 points per second remaining
-                        self.total_score = (self.completed_rooms * 1000) + self.time_bonus  # 1000 points per room + time bonus
-                        self.high_score = max(self.high_score, self.total_score)
-                        self.state = STATE_VICTORY
-                        print("¡Juego completado! Victoria.")
-
-                # Reiniciar el estado de interacción para evitar transiciones inmediatas
-                self.player.interacting = False
-
-            # Check if time is up
-            if self.timer.is_time_up():
-                self.state = STATE_GAME_OVER
+        handler = self._update_handlers.get(self.state)
+        if handler is not None:
+            handler()
+
+    def _update_path_selection(self):
+        """
+        Update the path selection screen.
+        """
+        if self.path_selection_player is not None:
+            self.path_selection_player.update()
+
+    def _update_game(self):
+        """
+        Update the main game state.
+        """
+        # La sala actual solo cambia al iniciar partida o en una transición
+        current_room = self.player.current_room
+        if not current_room.showing_info:
+            self.player.update()
+        current_room.update()
+        self.timer.update()
+        self.ui.update()
+
+        # Verificar si el jugador está cerca del área de la misión (solo para PMBOKInitiationRoom)
+       # if isinstance(current_room, PMBOKInitiationRoom):
+        #    if hasattr(current_room, 'check_mission_area'):
+         #       current_room.check_mission_area(self.player.rect)
+        if hasattr(current_room, 'check_mission_area'):
+            current_room.check_mission_area(self.player.rect)
+        if hasattr(current_room, 'check_info_area'):
+             current_room.check_info_area(self.player.rect)
+
+        # Verificar si se ha presionado la tecla de espacio para interactuar
+        # Bloquear interacción si se está mostrando el recuadro informativo
+        if self.player.is_interacting() and not current_room.showing_info:
+
+            # Verificar si el jugador está en un área de transición
+            in_transition_area = False
+            if hasattr(current_room, 'check_transition_area'):
+                in_transition_area = current_room.check_transition_area(self.player.rect)
+
+            # Si está en un área de transición y presiona espacio
+            if in_transition_area:
+                # Si es la sala 1, 2 o 3 de SCRUM, o la sala 1, 2 o 3 de PMBOK, ir a la siguiente sala
+                if type(current_room) in _ADVANCE_ROOMS and self.room_manager.has_next_room():
+                    # Incrementar contador de salas completadas
+                    self.completed_rooms += 1
+
+                    # Cambiar a la siguiente sala
+                    self.room_manager.go_to_next_room()
+                    current_room = self.room_manager.get_current_room()
+                    self.player.current_room = current_room
+
+                    # Posicionar al jugador según la sala de destino
+                    # (también las coordenadas x e y del jugador, para mantener consistencia)
+                    x, y = _ENTRY_XY.get(type(current_room), _DEFAULT_ENTRY_XY)
+                    self.player.rect.x = self.player.x = x
+                    self.player.rect.y = self.player.y = y
+
+                # Si es la sala 4 de PMBOK o la sala 3 de SCRUM, finalizar el juego
+                elif isinstance(current_room, PMBOKClosingRoom) or isinstance(current_room, ScrumEventsRoom):
+                    # Incrementar contador de salas completadas
+                    self.completed_rooms += 1
+
+                    # Calculate final score based on time left and rooms completed
+                    time_left = self.timer.get_time_left()
+                    self.time_bonus = int(time_left * 10)  # 10 points per second remaining
+                    self.total_score = (self.completed_rooms * 1000) + self.time_bonus  # 1000 points per room + time bonus
+                    self.high_score = max(self.high_score, self.total_score)
+                    self.state = STATE_VICTORY
+                    print("¡Juego completado! Victoria.")
+
+            # Reiniciar el estado de interacción para evitar transiciones inmediatas
+            self.player.interacting = False
+
+        # Check if time is up
+        if self.timer.is_time_up():
+            self.state = STATE_GAME_OVER
 
     def render(self):
         """
         Render the game based on current state.
+
+        Returns:
+            List of screen rects that changed since the previous frame
+            (empty if nothing changed), or None if the whole screen must be updated
         """
-        # Clear the screen
-        self.screen.fill(BLACK)
-
-        if self.state == STATE_MENU:
-            self._render_menu()
-        elif self.state == STATE_PATH_SELECTION:
-            self._render_path_selection()
-        elif self.state == STATE_INSTRUCTIONS:
-            self._render_instructions()
-        elif self.state == STATE_GAME:
-            self._render_game()
-        elif self.state == STATE_GAME_OVER:
-            self._render_game_over()
-        elif self.state == STATE_VICTORY:
-            self._render_victory()
+        # Las pantallas estáticas solo se dibujan en el primer frame tras entrar en ellas;
+        # después la pantalla ya tiene su contenido y no hace falta limpiarla ni redibujarla
+        state_changed = self.state != self._rendered_state
+        self._rendered_state = self.state
+        if self.state in _STATIC_STATES and not state_changed:
+            return []
+
+        # Clear the screen (unless the state's background already covers it)
+        if self.state not in _FULL_COVER_STATES:
+            self.screen.fill(BLACK)
+
+        handler = self._render_handlers.get(self.state)
+        if handler is not None:
+            handler()
+
+        return None
 
     def start_game(self, path):
         """
@@ -243,12 +336,26 @@ class Game:
         """
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_RETURN:
-                self.state = STATE_PATH_SELECTION
+                self._enter_path_selection()
             elif event.key == pygame.K_i:
                 self.state = STATE_INSTRUCTIONS
             elif event.key == pygame.K_ESCAPE:
-                pygame.quit()
-                sys.exit()
+                self.running = False
+
+    def _enter_path_selection(self):
+        """
+        Switch to the path selection state, creating its player if needed.
+        """
+        # Si no hay un jugador creado para la selección, créalo
+        if self.path_selection_player is None:
+            self.path_selection_player = Player()
+            # Posicionar al jugador en el centro de la pantalla
+            self.path_selection_player.x = WINDOW_WIDTH // 2 - self.path_selection_player.width // 2
+            self.path_selection_player.y = WINDOW_HEIGHT // 2 + 50  # Un poco más abajo del centro
+            self.path_selection_player.rect.x = int(self.path_selection_player.x)
+            self.path_selection_player.rect.y = int(self.path_selection_player.y)
+
+        self.state = STATE_PATH_SELECTION
 
     def _handle_path_selection_event(self, event):
         """
@@ -261,26 +368,17 @@ class Game:
             if event.key == pygame.K_ESCAPE:
                 self.state = STATE_MENU
 
-        # Si no hay un jugador creado para la selección, créalo
-        if not hasattr(self, 'path_selection_player') or self.path_selection_player is None:
-            self.path_selection_player = Player()
-            # Posicionar al jugador en el centro de la pantalla
-            self.path_selection_player.x = WINDOW_WIDTH // 2 - self.path_selection_player.width // 2
-            self.path_selection_player.y = WINDOW_HEIGHT // 2 + 50  # Un poco más abajo del centro
-            self.path_selection_player.rect.x = int(self.path_selection_player.x)
-            self.path_selection_player.rect.y = int(self.path_selection_player.y)
-
         # Manejar eventos del jugador
         self.path_selection_player.handle_event(event)
 
         # Verificar si el jugador ha elegido un camino
         # Si el jugador se mueve lo suficientemente a la izquierda, elige SCRUM
-        if self.path_selection_player.x < WINDOW_WIDTH // 3:
+        if self.path_selection_player.x < PATH_SCRUM_X_MAX:
             self.start_game(PATH_SCRUM)
             self.path_selection_player = None  # Limpiar el jugador de selección
 
         # Si el jugador se mueve lo suficientemente a la derecha, elige PMBOK
-        elif self.path_selection_player.x > (WINDOW_WIDTH * 2) // 3:
+        elif self.path_selection_player.x > PATH_PMBOK_X_MIN:
             self.start_game(PATH_PMBOK)
             self.path_selection_player = None  # Limpiar el jugador de selección
 
@@ -306,11 +404,8 @@ class Game:
             if event.key == pygame.K_ESCAPE:
                 self.state = STATE_MENU
 
-        # Get current room
-        current_room = self.room_manager.get_current_room()
-
-        # Update player's current room reference
-        self.player.current_room = current_room
+        # Get current room (kept up to date by start_game and room transitions)
+        current_room = self.player.current_room
 
         # Ya no usamos la transición al tocar el borde superior
         # Ahora todas las transiciones se manejan con el área de transición y la tecla ESPACIO
@@ -332,27 +427,30 @@ class Game:
             if event.key == pygame.K_RETURN:
                 self.state = STATE_MENU
             elif event.key == pygame.K_ESCAPE:
-                pygame.quit()
-                sys.exit()
+                self.running = False
 
-    def _render_menu(self):
+    def _build_menu_background(self):
         """
-        Render the menu screen in Stardew Valley style.
+        Build the static part of the menu screen: background image, border, titles, buttons,
+        sparkles and version label.
+
+        Returns:
+            Pygame Surface of the window size
         """
-        # Load and scale the background image to fit the window size
-        background = pygame.image.load("img/remix_2.png")
-        background = pygame.transform.scale(background, (WINDOW_WIDTH, WINDOW_HEIGHT))
-        self.screen.blit(background, (0, 0))
+        menu_background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+        # Background image (loaded and scaled to the window by the asset manager)
+        menu_background.blit(assets.get_image("menu_background"), (0, 0))
 
         # Draw decorative elements
         # Top and bottom borders
         border_rect = pygame.Rect(20, 20, WINDOW_WIDTH - 40, WINDOW_HEIGHT - 40)
-        draw_decorative_border(self.screen, border_rect, SDV_BROWN, width=3, corner_size=30)
+        draw_decorative_border(menu_background, border_rect, SDV_BROWN, width=3, corner_size=30)
 
         # Draw title with stylized text
         title_font = assets.fonts["stardew_large"]
         draw_stardew_title(
-            self.screen,
+            menu_background,
             "Escape Room",
             title_font,
             WINDOW_WIDTH // 2,
@@ -363,7 +461,7 @@ class Game:
 
         subtitle_font = assets.fonts["stardew_medium"]
         draw_stardew_title(
-            self.screen,
+            menu_background,
             "PMBOK vs Scrum",
             subtitle_font,
             WINDOW_WIDTH // 2,
@@ -372,7 +470,7 @@ class Game:
             shadow_color=SDV_DARK_GREEN
         )
 
-        # Draw buttons in Stardew Valley style
+        # Draw buttons in Stardew Valley style (they have no hover state)
         button_width = 250
         button_height = 50
         button_x = WINDOW_WIDTH // 2 - button_width // 2
@@ -380,7 +478,7 @@ class Game:
         # Start button
         start_rect = pygame.Rect(button_x, WINDOW_HEIGHT // 2, button_width, button_height)
         draw_stardew_button(
-            self.screen,
+            menu_background,
             start_rect,
             "Start Game",
             self.font_medium,
@@ -392,7 +490,7 @@ class Game:
         # Instructions button
         instructions_rect = pygame.Rect(button_x, WINDOW_HEIGHT // 2 + 70, button_width, button_height)
         draw_stardew_button(
-            self.screen,
+            menu_background,
             instructions_rect,
             "Instructions",
             self.font_medium,
@@ -404,7 +502,7 @@ class Game:
         # Exit button
         exit_rect = pygame.Rect(button_x, WINDOW_HEIGHT // 2 + 140, button_width, button_height)
         draw_stardew_button(
-            self.screen,
+            menu_background,
             exit_rect,
             "Exit Game",
             self.font_medium,
@@ -414,19 +512,28 @@ class Game:
         )
 
         # Draw decorative elements
-        # Draw small stars/sparkles
+        # Draw small stars/sparkles (fixed positions, so they no longer flicker)
         for _ in range(20):
             x = random.randint(30, WINDOW_WIDTH - 30)
             y = random.randint(30, WINDOW_HEIGHT - 30)
             size = random.randint(1, 3)
             brightness = random.uniform(0.5, 1.0)
             color = color_lerp(SDV_YELLOW, WHITE, brightness)
-            pygame.draw.circle(self.screen, color, (x, y), size)
+            pygame.draw.circle(menu_background, color, (x, y), size)
 
         # Draw version text
         version_text = self.font_small.render("v1.0", True, WHITE)
         version_rect = version_text.get_rect(bottomright=(WINDOW_WIDTH - 10, WINDOW_HEIGHT - 10))
-        self.screen.blit(version_text, version_rect)
+        menu_background.blit(version_text, version_rect)
+
+        return menu_background
+
+    def _render_menu(self):
+        """
+        Render the menu screen in Stardew Valley style.
+        """
+        # Background image, border, titles, buttons, sparkles and version (pre-composed)
+        self.screen.blit(self._menu_background, (0, 0))
 
     def _render_path_selection(self):
         """
@@ -437,33 +544,36 @@ class Game:
         self.screen.blit(background, (0, 0))
 
         # Renderizar al jugador si existe
-        if hasattr(self, 'path_selection_player') and self.path_selection_player is not None:
+        if self.path_selection_player is not None:
             self.path_selection_player.render(self.screen)
 
+    def _build_instructions_texts(self):
+        """
+        Render the instructions screen labels once.
+
+        Returns:
+            List of (surface, rect) pairs ready to blit
+        """
+        labels = [
+            (self.font_large, "Instructions", WINDOW_HEIGHT // 4),
+            (self.font_small, "Use arrow keys to move the player", WINDOW_HEIGHT // 2 - 60),
+            (self.font_small, "Move between rooms by reaching the top of the screen", WINDOW_HEIGHT // 2 - 20),
+            (self.font_small, "Explore each room to learn about project management", WINDOW_HEIGHT // 2 + 20),
+            (self.font_small, "Progress through all rooms to complete your path", WINDOW_HEIGHT // 2 + 60),
+            (self.font_small, "Press ESC or ENTER to go back", WINDOW_HEIGHT - 50)
+        ]
+
+        texts = []
+        for font, text, center_y in labels:
+            surface = font.render(text, True, WHITE).convert_alpha()
+            texts.append((surface, surface.get_rect(center=(WINDOW_WIDTH // 2, center_y))))
+        return texts
+
     def _render_instructions(self):
         """
         Render the instructions screen.
         """
-        title = self.font_large.render("Instructions", True, WHITE)
-        instruction1 = self.font_small.render("Use arrow keys to move the player", True, WHITE)
-        instruction2 = self.font_small.render("Move between rooms by reaching the top of the screen", True, WHITE)
-        instruction3 = self.font_small.render("Explore each room to learn about project management", True, WHITE)
-        instruction4 = self.font_small.render("Progress through all rooms to complete your path", True, WHITE)
-        back_text = self.font_small.render("Press ESC or ENTER to go back", True, WHITE)
-
-        title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 4))
-        instruction1_rect = instruction1.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 60))
-        instruction2_rect = instruction2.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 20))
-        instruction3_rect = instruction3.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20))
-        instruction4_rect = instruction4.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 60))
-        back_rect = back_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50))
-
-        self.screen.blit(title, title_rect)
-        self.screen.blit(instruction1, instruction1_rect)
-        self.screen.blit(instruction2, instruction2_rect)
-        self.screen.blit(instruction3, instruction3_rect)
-        self.screen.blit(instruction4, instruction4_rect)
-        self.screen.blit(back_text, back_rect)
+        self.screen.blits(self._instructions_texts, doreturn=False)
 
     def _render_game(self):
         """
@@ -474,139 +584,73 @@ class Game:
         # self.screen.blit(background, (0, 0))
 
         # Renderizar la sala actual (que puede tener su propio fondo)
-        current_room = self.room_manager.get_current_room()
+        current_room = self.player.current_room
         if current_room:
             current_room.render(self.screen)
 
-        # Renderizar al jugador directamente sobre la sala, pero solo si no hay una actividad activa
-        if self.player:
-            # Verificar si hay una actividad activa en la sala actual
-            activity_active = False
-            if hasattr(current_room, 'activity'):
-                activity_active = current_room.activity.active
+        # Verificar si hay una actividad activa en la sala actual
+        activity = current_room.activity
+        activity_active = activity is not None and activity.active
 
-            # Solo renderizar al jugador si no hay actividad activa
-            if not activity_active:
-                self.player.render(self.screen)
+        # Renderizar al jugador directamente sobre la sala, pero solo si no hay una actividad activa
+        if self.player and not activity_active:
+            self.player.render(self.screen)
 
         # Renderizar la actividad después del jugador (si existe y está activa)
-        if hasattr(current_room, 'activity') and current_room.activity.active:
-            if current_room.activity.active:
-                current_room.activity.render(self.screen)
+        if activity_active:
+            activity.render(self.screen)
 
 
 
         # Render UI elements
         self.ui.render_game_ui(self.screen, self.timer)
 
+    def _game_over_labels(self):
+        """
+        Score lines of the game over screen.
+
+        Returns:
+            List of (font, text, color, y offset from the panel top)
+        """
+        return [
+            (self.font_medium, f"Your Score: {self.total_score}", YELLOW, 180),
+            (self.font_small, f"High Score: {self.high_score}", ORANGE, 220),
+            (self.font_small, f"Rooms Completed: {self.completed_rooms}", WHITE, 250)
+        ]
+
+    def _victory_labels(self):
+        """
+        Congratulations and score breakdown lines of the victory screen.
+
+        Returns:
+            List of (font, text, color, y offset from the panel top)
+        """
+        puzzle_score = self.total_score - self.time_bonus
+        if self.total_score >= self.high_score:
+            high_score_label = (self.font_medium, "New High Score!", ORANGE, 340)
+        else:
+            high_score_label = (self.font_small, f"High Score: {self.high_score}", ORANGE, 340)
+        return [
+            (self.font_medium, f"Congratulations! You've mastered the {self.selected_path.upper()} path.", WHITE, 120),
+            (self.font_medium, f"Final Score: {self.total_score}", YELLOW, 180),
+            (self.font_small, f"Puzzle Points: {puzzle_score}", WHITE, 230),
+            (self.font_small, f"Time Bonus: {self.time_bonus}", CYAN, 260),
+            (self.font_small, f"Rooms Completed: {self.completed_rooms}", WHITE, 290),
+            high_score_label
+        ]
+
     def _render_game_over(self):
         """
         Render the game over screen.
         """
-        # Draw background panel
-        panel_width = 600
-        panel_height = 400
-        panel_x = (WINDOW_WIDTH - panel_width) // 2
-        panel_y = (WINDOW_HEIGHT - panel_height) // 2
-
-        pygame.draw.rect(self.screen, CHARCOAL,
-                        (panel_x, panel_y, panel_width, panel_height),
-                        border_radius=15)
-        pygame.draw.rect(self.screen, RED,
-                        (panel_x, panel_y, panel_width, panel_height),
-                        3, border_radius=15)
-
-        # Draw header
-        game_over_text = self.font_large.render("Game Over", True, RED)
-        game_over_rect = game_over_text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 50))
-        self.screen.blit(game_over_text, game_over_rect)
-
-        # Draw reason
-        reason_text = self.font_medium.render("Time's up! You couldn't escape in time.", True, WHITE)
-        reason_rect = reason_text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 120))
-        self.screen.blit(reason_text, reason_rect)
-
-        # Draw score information
-        score_text = self.font_medium.render(f"Your Score: {self.total_score}", True, YELLOW)
-        score_rect = score_text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 180))
-        self.screen.blit(score_text, score_rect)
-
-        high_score_text = self.font_small.render(f"High Score: {self.high_score}", True, ORANGE)
-        high_score_rect = high_score_text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 220))
-        self.screen.blit(high_score_text, high_score_rect)
-
-        rooms_text = self.font_small.render(f"Rooms Completed: {self.completed_rooms}", True, WHITE)
-        rooms_rect = rooms_text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 250))
-        self.screen.blit(rooms_text, rooms_rect)
-
-        # Draw buttons
-        restart_text = self.font_medium.render("Press ENTER to return to menu", True, WHITE)
-        restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 320))
-        self.screen.blit(restart_text, restart_rect)
-
-        exit_text = self.font_small.render("Press ESC to exit", True, WHITE)
-        exit_rect = exit_text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 360))
-        self.screen.blit(exit_text, exit_rect)
+        # Draw the panel with header, reason, score information and key hints
+        panel = self._get_end_screen(self._game_over_panel, self._game_over_panel_rect, self._game_over_labels)
+        self.screen.blit(panel, self._game_over_panel_rect)
 
     def _render_victory(self):
         """
         Render the victory screen.
         """
-        # Draw background panel
-        panel_width = 700
-        panel_height = 500
-        panel_x = (WINDOW_WIDTH - panel_width) // 2
-        panel_y = (WINDOW_HEIGHT - panel_height) // 2
-
-        pygame.draw.rect(self.screen, CHARCOAL,
-                        (panel_x, panel_y, panel_width, panel_height),
-                        border_radius=15)
-        pygame.draw.rect(self.screen, GREEN,
-                        (panel_x, panel_y, panel_width, panel_height),
-                        3, border_radius=15)
-
-        # Draw header
-        victory_text = self.font_large.render("Victory!", True, GREEN)
-        victory_rect = victory_text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 50))
-        self.screen.blit(victory_text, victory_rect)
-
-        # Draw congratulations
-        congrats_text = self.font_medium.render(f"Congratulations! You've mastered the {self.selected_path.upper()} path.", True, WHITE)
-        congrats_rect = congrats_text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 120))
-        self.screen.blit(congrats_text, congrats_rect)
-
-        # Draw score breakdown
-        score_text = self.font_medium.render(f"Final Score: {self.total_score}", True, YELLOW)
-        score_rect = score_text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 180))
-        self.screen.blit(score_text, score_rect)
-
-        # Draw score components
-        puzzle_score = self.total_score - self.time_bonus
-        puzzle_text = self.font_small.render(f"Puzzle Points: {puzzle_score}", True, WHITE)
-        puzzle_rect = puzzle_text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 230))
-        self.screen.blit(puzzle_text, puzzle_rect)
-
-        time_text = self.font_small.render(f"Time Bonus: {self.time_bonus}", True, CYAN)
-        time_rect = time_text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 260))
-        self.screen.blit(time_text, time_rect)
-
-        rooms_text = self.font_small.render(f"Rooms Completed: {self.completed_rooms}", True, WHITE)
-        rooms_rect = rooms_text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 290))
-        self.screen.blit(rooms_text, rooms_rect)
-
-        # Draw high score
-        if self.total_score >= self.high_score:
-            high_score_text = self.font_medium.render("New High Score!", True, ORANGE)
-        else:
-            high_score_text = self.font_small.render(f"High Score: {self.high_score}", True, ORANGE)
-        high_score_rect = high_score_text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 340))
-        self.screen.blit(high_score_text, high_score_rect)
-
-        # Draw buttons
-        restart_text = self.font_medium.render("Press ENTER to return to menu", True, WHITE)
-        restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 400))
-        self.screen.blit(restart_text, restart_rect)
-
-        exit_text = self.font_small.render("Press ESC to exit", True, WHITE)
-        exit_rect = exit_text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 440))
-        self.screen.blit(exit_text, exit_rect)
+        # Draw the panel with header, congratulations, score breakdown and key hints
+        panel = self._get_end_screen(self._victory_panel, self._victory_panel_rect, self._victory_labels)
+        self.screen.blit(panel, self._victory_panel_rect)
@@ -21,6 +21,21 @@ def main():
     screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
     pygame.display.set_caption(WINDOW_TITLE)
 
+    # Only queue the event types the game reacts to; SDL drops the rest
+    # (window expose/restore events are kept so static screens get repainted)
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([
+        pygame.QUIT,
+        pygame.WINDOWEXPOSED,
+        pygame.WINDOWRESTORED,
+        pygame.VIDEOEXPOSE,
+        pygame.KEYDOWN,
+        pygame.KEYUP,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEMOTION
+    ])
+
     # Initialize assets and fonts (después de inicializar pygame.display)
     assets.initialize()
     assets.initialize_fonts()
@@ -32,22 +47,29 @@ def main():
     game = Game(screen)
 
     # Main game loop
-    running = True
-    while running:
+    while game.running:
         # Handle events
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        for i, event in enumerate(events):
+            # Skip mouse motion that is immediately superseded by a newer one
+            if (event.type == pygame.MOUSEMOTION and i + 1 < len(events)
+                    and events[i + 1].type == pygame.MOUSEMOTION):
+                continue
             if event.type == pygame.QUIT:
-                running = False
+                game.running = False
             game.handle_event(event)
 
         # Update game state
         game.update()
 
         # Render game
-        game.render()
+        dirty_rects = game.render()
 
-        # Update display
-        pygame.display.flip()
+        # Update display (only the changed areas when the game reports them)
+        if dirty_rects is None:
+            pygame.display.flip()
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
 
         # Control frame rate
         clock.tick(FPS)
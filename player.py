@@ -163,7 +163,8 @@ class Player:
         # Verificar si hay una actividad activa en la sala actual
         # Si hay una actividad activa, no permitir el movimiento
         if hasattr(self, 'current_room') and self.current_room:
-            if hasattr(self.current_room, 'activity') and self.current_room.activity.active:
+            activity = self.current_room.activity
+            if activity is not None and activity.active:
                 return
 
         # Calculate movement based on direction flags
@@ -301,7 +302,7 @@ class Player:
         animation_key = f"player_{self.direction}"
 
         # Obtener la lista de frames para esta dirección
-        frames = assets.animations.get(animation_key, [])
+        frames = assets.animations.get(animation_key, ())
 
         # Si no hay frames disponibles, usar la imagen estática
         if not frames:
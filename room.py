@@ -32,6 +32,8 @@ class Room:
         self.decorations = []
         self.completed = False
         self.completion_time = 0
+        self.activity = None  # Actividad (minijuego) de la sala, si la tiene
+        self.showing_info = False  # Recuadro informativo abierto
 
         # Room dimensions and position
         self.width = ROOM_WIDTH
@@ -55,15 +57,30 @@ class Room:
         """
         Create decorative elements for the room.
         """
+        # Pulse parameters per type: (base size, wave function, time factor)
+        pulse_params = {
+            'dot': (2, math.sin, 1),
+            'square': (3, math.cos, 1),
+            'line': (4, math.sin, 2)
+        }
+
         # Add random decorative elements based on theme
         for _ in range(10):
+            decoration_type = random.choice(['dot', 'square', 'line'])
+            color = self._get_theme_color(random.uniform(0.7, 1.0))
+            alpha = random.randint(40, 120)
+            base, wave, factor = pulse_params[decoration_type]
             decoration = {
-                'type': random.choice(['dot', 'square', 'line']),
+                'type': decoration_type,
                 'x': random.randint(self.x + 20, self.x + self.width - 20),
                 'y': random.randint(self.y + 20, self.y + self.height - 20),
                 'size': random.randint(2, 8),
-                'color': self._get_theme_color(random.uniform(0.7, 1.0)),
-                'alpha': random.randint(40, 120),
+                'color': color,
+                'alpha': alpha,
+                'rgba': (*color, alpha),  # Precomputed draw color
+                'base': base,
+                'wave': wave,
+                'factor': factor,
                 'speed': random.uniform(0.01, 0.05),
                 'time': random.uniform(0, 2 * math.pi)
             }
@@ -119,13 +136,8 @@ class Room:
         for decoration in self.decorations:
             decoration['time'] += decoration['speed']
 
-            # Make decorations pulse or move slightly
-            if decoration['type'] == 'dot':
-                decoration['size'] = 2 + math.sin(decoration['time']) * 2
-            elif decoration['type'] == 'square':
-                decoration['size'] = 3 + math.cos(decoration['time']) * 2
-            elif decoration['type'] == 'line':
-                decoration['size'] = 4 + math.sin(decoration['time'] * 2) * 2
+            # Make decorations pulse or move slightly (parameters set per type on creation)
+            decoration['size'] = decoration['base'] + decoration['wave'](decoration['time'] * decoration['factor']) * 2
 
     def handle_event(self, event):
         """
@@ -172,7 +184,7 @@ class Room:
             screen: Pygame surface to render on
         """
         for decoration in self.decorations:
-            color = (*decoration['color'], decoration['alpha'])
+            color = decoration['rgba']
 
             if decoration['type'] == 'dot':
                 pygame.draw.circle(
@@ -321,6 +333,22 @@ class RoomManager:
 
 
 # PMBOK Room Classes
+# Geometría de la actividad PMBOK (panel 20% más grande que el original)
+PMBOK_PANEL_WIDTH = 600   # Antes 500
+PMBOK_PANEL_HEIGHT = 480  # Antes 400
+PMBOK_PANEL_X = (WINDOW_WIDTH - PMBOK_PANEL_WIDTH) // 2
+PMBOK_PANEL_Y = (WINDOW_HEIGHT - PMBOK_PANEL_HEIGHT) // 2
+PMBOK_ITEM_WIDTH = 288    # Antes 240 (240 * 1.2 = 288)
+PMBOK_ITEM_HEIGHT = 96    # Antes 80 (80 * 1.2 = 96)
+PMBOK_TARGET_WIDTH = 216  # Antes 180 (180 * 1.2 = 216)
+PMBOK_TARGET_HEIGHT = 48  # Antes 40 (40 * 1.2 = 48)
+PMBOK_ROW_SPACING = 30    # Antes 25
+
+# Panel de resultado y botones de cerrar (no se modifican, solo se copian)
+PMBOK_RESULT_RECT = pygame.Rect(WINDOW_WIDTH // 2 - 250, WINDOW_HEIGHT // 2 - 60, 500, 120)
+PMBOK_ERROR_CLOSE_RECT = pygame.Rect(WINDOW_WIDTH // 2 - 40, WINDOW_HEIGHT // 2 + 30, 80, 30)
+PMBOK_CLOSE_RECT = pygame.Rect(WINDOW_WIDTH // 2 - 60, WINDOW_HEIGHT // 2 + 100, 120, 45)
+
 class PMBOKActivity:
     """
     Clase para manejar la actividad educativa de PMBOK.
@@ -331,6 +359,12 @@ class PMBOKActivity:
         self.font_medium = assets.get_font("medium")
         self.font_small = assets.get_font("small")
 
+        # Fuentes por defecto usadas en el panel (se crean una sola vez)
+        self.font_title = pygame.font.Font(None, 22)  # Título del panel
+        self.font_item = pygame.font.Font(None, 14)  # Texto de los elementos y botón de error
+        self.font_target = pygame.font.Font(None, 16)  # Objetivos y botón de cerrar
+        self.font_result = pygame.font.Font(None, 18)  # Mensaje de resultado
+
         # Elementos de la actividad - Textos resumidos para mejor visualización
         self.items = [
             {"text": "Crear un videojuego educativo en 2D, tipo escape room, para aprender metodologías PMBOK y Scrum mediante desafíos interactivos.", "position": "left", "correct_target": "Definición del proyecto"},
@@ -345,16 +379,25 @@ class PMBOKActivity:
         ]
 
         self.selected_item = None
+        self.matched_count = 0  # Número de relaciones correctas hechas
         self.completed = False
         self.show_result = False
         self.result_message = ""
         self.result_color = GREEN
 
+        # Capa estática (fondo semitransparente, panel y título) creada una sola vez
+        self.static_layer = self._build_static_layer()
+
+        # Rectángulos de elementos y objetivos (la geometría es fija)
+        self.item_rects = [self._get_item_rect(i) for i in range(len(self.items))]
+        self.target_rects = [self._get_target_rect(i) for i in range(len(self.targets))]
+
     def activate(self):
         """Activar la actividad"""
         self.active = True
         self.completed = False
         self.show_result = False
+        self.matched_count = 0
         # Reiniciar el estado de los elementos
         for item in self.items:
             item["matched"] = False
@@ -378,15 +421,13 @@ class PMBOKActivity:
                 if self.show_result:
                     # Si la actividad está completada, mostrar el botón de cerrar
                     if self.completed:
-                        close_rect = pygame.Rect(WINDOW_WIDTH // 2 - 60, WINDOW_HEIGHT // 2 + 100, 120, 45)
-                        if close_rect.collidepoint(mouse_pos):
+                        if PMBOK_CLOSE_RECT.collidepoint(mouse_pos):
                             self.deactivate()
                             return
                     else:
                         # Si es un mensaje de error, cualquier clic lo cierra
                         # Añadir un botón específico para cerrar el mensaje de error
-                        error_close_rect = pygame.Rect(WINDOW_WIDTH // 2 - 40, WINDOW_HEIGHT // 2 + 30, 80, 30)
-                        if error_close_rect.collidepoint(mouse_pos):
+                        if PMBOK_ERROR_CLOSE_RECT.collidepoint(mouse_pos):
                             self.show_result = False
                             return
 
@@ -396,44 +437,47 @@ class PMBOKActivity:
                         self.show_result = False
                         return
 
+                # Rectángulo de 1x1 en la posición del ratón para usar collidelist
+                mouse_rect = pygame.Rect(mouse_pos, (1, 1))
+
                 # Verificar si se seleccionó un elemento
                 if self.selected_item is None:
-                    for i, item in enumerate(self.items):
-                        item_rect = self._get_item_rect(i)
-                        if item_rect.collidepoint(mouse_pos) and not item.get("matched", False):
-                            self.selected_item = i
-                            print(f"Elemento seleccionado: {i}")
-                            return  # Salir después de seleccionar un elemento
+                    i = mouse_rect.collidelist(self.item_rects)
+                    if i != -1 and not self.items[i].get("matched", False):
+                        self.selected_item = i
+                        print(f"Elemento seleccionado: {i}")
+                        return  # Salir después de seleccionar un elemento
                 else:
                     # Verificar si se seleccionó un objetivo
-                    for i, target in enumerate(self.targets):
-                        target_rect = self._get_target_rect(i)
-                        if target_rect.collidepoint(mouse_pos) and not target.get("matched", False):
-                            # Comprobar si la relación es correcta
-                            if self.items[self.selected_item]["correct_target"] == target["name"]:
-                                # Relación correcta
-                                print(f"Relación correcta: {self.items[self.selected_item]['text']} -> {target['name']}")
-                                self.items[self.selected_item]["matched"] = True
-                                target["matched"] = True
-
-                                # Verificar si se completó la actividad
-                                if all(item.get("matched", False) for item in self.items):
-                                    self.completed = True
-                                    self.show_result = True
-                                    self.result_message = "¡Excelente! Has relacionado correctamente todos los elementos."
-                                    self.result_color = GREEN
-                            else:
-                                # Relación incorrecta
-                                print(f"Relación incorrecta: {self.items[self.selected_item]['text']} -> {target['name']}")
+                    i = mouse_rect.collidelist(self.target_rects)
+                    if i != -1 and not self.targets[i].get("matched", False):
+                        target = self.targets[i]
+                        # Comprobar si la relación es correcta
+                        if self.items[self.selected_item]["correct_target"] == target["name"]:
+                            # Relación correcta
+                            print(f"Relación correcta: {self.items[self.selected_item]['text']} -> {target['name']}")
+                            self.items[self.selected_item]["matched"] = True
+                            target["matched"] = True
+                            self.matched_count += 1
+
+                            # Verificar si se completó la actividad
+                            if self.matched_count == len(self.items):
+                                self.completed = True
                                 self.show_result = True
-                                self.result_message = "Relación incorrecta. Inténtalo de nuevo."
-                                self.result_color = RED
+                                self.result_message = "¡Excelente! Has relacionado correctamente todos los elementos."
+                                self.result_color = GREEN
+                        else:
+                            # Relación incorrecta
+                            print(f"Relación incorrecta: {self.items[self.selected_item]['text']} -> {target['name']}")
+                            self.show_result = True
+                            self.result_message = "Relación incorrecta. Inténtalo de nuevo."
+                            self.result_color = RED
 
-                            self.selected_item = None
-                            return  # Salir después de intentar una relación
+                        self.selected_item = None
+                        return  # Salir después de intentar una relación
 
                     # Si se hizo clic en cualquier otro lugar, deseleccionar
-                    if not any(self._get_target_rect(i).collidepoint(mouse_pos) for i in range(len(self.targets))):
+                    if i == -1:
                         print("Deseleccionando elemento")
                         self.selected_item = None
 
@@ -442,28 +486,12 @@ class PMBOKActivity:
         if not self.active:
             return
 
-        # Dibujar el fondo semitransparente
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))  # Negro semitransparente
-        screen.blit(overlay, (0, 0))
-
-        # Dibujar el panel principal (20% más grande)
-        panel_width = 600  # Antes 500
-        panel_height = 480  # Antes 400
-        panel_x = (WINDOW_WIDTH - panel_width) // 2
-        panel_y = (WINDOW_HEIGHT - panel_height) // 2
-
-        draw_panel(screen, panel_x, panel_y, panel_width, panel_height, CHARCOAL, WHITE, 3, 15)
-
-        # Dibujar el título con una fuente más pequeña
-        font_title = pygame.font.Font(None, 22)  # Fuente más pequeña para el título
-        title_text = font_title.render("Relaciona los elementos con su contexto", True, WHITE)
-        title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, panel_y + 40))
-        screen.blit(title_text, title_rect)
+        # Dibujar el fondo semitransparente, el panel y el título (pre-renderizados)
+        screen.blit(self.static_layer, (0, 0))
 
         # Dibujar los elementos a relacionar
         for i, item in enumerate(self.items):
-            item_rect = self._get_item_rect(i)
+            item_rect = self.item_rects[i]
             color = GREEN if item.get("matched", False) else WHITE
             # Dibujar con borde más grueso y más redondeado
             pygame.draw.rect(screen, color, item_rect, 3, border_radius=10)
@@ -475,7 +503,7 @@ class PMBOKActivity:
             current_line = []
 
             # Usar una fuente más pequeña para el texto
-            font_to_use = pygame.font.Font(None, 14)  # Reducir el tamaño de la fuente a 14
+            font_to_use = self.font_item
 
             for word in words:
                 test_line = " ".join(current_line + [word])
@@ -510,20 +538,19 @@ class PMBOKActivity:
 
         # Dibujar los objetivos
         for i, target in enumerate(self.targets):
-            target_rect = self._get_target_rect(i)
+            target_rect = self.target_rects[i]
             color = GREEN if target.get("matched", False) else WHITE
             pygame.draw.rect(screen, color, target_rect, 2, border_radius=8)  # Borde más redondeado
 
             # Usar una fuente más pequeña y centrar mejor el texto
-            font_target = pygame.font.Font(None, 16)  # Fuente más pequeña para los objetivos
-            target_text = font_target.render(target["name"], True, color)
+            target_text = self.font_target.render(target["name"], True, color)
             text_rect = target_text.get_rect(center=(target_rect.centerx, target_rect.centery))
             screen.blit(target_text, text_rect)
 
         # Si se está mostrando el resultado
         if self.show_result:
             # Crear un panel de resultado más atractivo
-            result_rect = pygame.Rect(WINDOW_WIDTH // 2 - 250, WINDOW_HEIGHT // 2 - 60, 500, 120)
+            result_rect = PMBOK_RESULT_RECT
 
             # Dibujar un panel con borde redondeado y sombra
             shadow_rect = result_rect.copy()
@@ -535,14 +562,13 @@ class PMBOKActivity:
             draw_panel(screen, result_rect.x, result_rect.y, result_rect.width, result_rect.height, CHARCOAL, self.result_color, 3, 15)
 
             # Dibujar el mensaje con una fuente más pequeña y clara
-            font_result = pygame.font.Font(None, 18)  # Usar la fuente por defecto con tamaño 18
-            text_surface = font_result.render(self.result_message, True, WHITE)
+            text_surface = self.font_result.render(self.result_message, True, WHITE)
             text_rect = text_surface.get_rect(center=(result_rect.centerx, result_rect.centery))
             screen.blit(text_surface, text_rect)
 
             # Si es un mensaje de error, mostrar un botón de cerrar más pequeño
             if not self.completed:
-                error_close_rect = pygame.Rect(WINDOW_WIDTH // 2 - 40, WINDOW_HEIGHT // 2 + 30, 80, 30)
+                error_close_rect = PMBOK_ERROR_CLOSE_RECT
                 # Sombra para el botón
                 shadow_btn = error_close_rect.copy()
                 shadow_btn.x += 2
@@ -551,14 +577,13 @@ class PMBOKActivity:
                 # Botón principal
                 draw_panel(screen, error_close_rect.x, error_close_rect.y, error_close_rect.width, error_close_rect.height, CHARCOAL, self.result_color, 2, 5)
                 # Texto del botón
-                font_btn = pygame.font.Font(None, 14)  # Fuente más pequeña para el botón de error
-                btn_text = font_btn.render("Cerrar", True, WHITE)
+                btn_text = self.font_item.render("Cerrar", True, WHITE)
                 btn_rect = btn_text.get_rect(center=(error_close_rect.centerx, error_close_rect.centery))
                 screen.blit(btn_text, btn_rect)
 
             # Botón de cerrar si la actividad está completada
             if self.completed:
-                close_rect = pygame.Rect(WINDOW_WIDTH // 2 - 60, WINDOW_HEIGHT // 2 + 100, 120, 45)
+                close_rect = PMBOK_CLOSE_RECT
 
                 # Sombra para el botón
                 shadow_btn = close_rect.copy()
@@ -570,53 +595,44 @@ class PMBOKActivity:
                 draw_panel(screen, close_rect.x, close_rect.y, close_rect.width, close_rect.height, CHARCOAL, GREEN, 2, 10)
 
                 # Texto del botón
-                font_btn = pygame.font.Font(None, 16)  # Usar la fuente por defecto con tamaño 16
-                btn_text = font_btn.render("Cerrar", True, WHITE)
+                btn_text = self.font_target.render("Cerrar", True, WHITE)
                 btn_rect = btn_text.get_rect(center=(close_rect.centerx, close_rect.centery))
                 screen.blit(btn_text, btn_rect)
 
-    def _get_item_rect(self, index):
-        """Obtener el rectángulo para un elemento"""
-        # Aumentar el tamaño del panel principal en un 20%
-        panel_width = 600  # Antes 500
-        panel_height = 480  # Antes 400
-        panel_x = (WINDOW_WIDTH - panel_width) // 2
-        panel_y = (WINDOW_HEIGHT - panel_height) // 2
+    def _build_static_layer(self):
+        """Construir la capa que no cambia entre frames: fondo, panel y título"""
+        layer = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        layer.fill((0, 0, 0, 200))  # Negro semitransparente
 
-        # Aumentar el ancho y la altura de los elementos en un 20%
-        item_width = 288  # Antes 240 (240 * 1.2 = 288)
-        item_height = 96  # Antes 80 (80 * 1.2 = 96)
+        # Dibujar el panel principal (20% más grande)
+        draw_panel(layer, PMBOK_PANEL_X, PMBOK_PANEL_Y, PMBOK_PANEL_WIDTH, PMBOK_PANEL_HEIGHT, CHARCOAL, WHITE, 3, 15)
 
+        # Dibujar el título con una fuente más pequeña
+        title_text = self.font_title.render("Relaciona los elementos con su contexto", True, WHITE)
+        title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, PMBOK_PANEL_Y + 40))
+        layer.blit(title_text, title_rect)
+
+        return layer
+
+    def _get_item_rect(self, index):
+        """Obtener el rectángulo para un elemento"""
         # Ajustar la posición para mantener el centrado
-        item_x = panel_x + 30  # Ajustado para centrar mejor
+        item_x = PMBOK_PANEL_X + 30  # Ajustado para centrar mejor
 
         # Distribuir los elementos verticalmente con más espacio
-        spacing = 30  # Antes 25
-        item_y = panel_y + 90 + index * (item_height + spacing)
+        item_y = PMBOK_PANEL_Y + 90 + index * (PMBOK_ITEM_HEIGHT + PMBOK_ROW_SPACING)
 
-        return pygame.Rect(item_x, item_y, item_width, item_height)
+        return pygame.Rect(item_x, item_y, PMBOK_ITEM_WIDTH, PMBOK_ITEM_HEIGHT)
 
     def _get_target_rect(self, index):
         """Obtener el rectángulo para un objetivo"""
-        # Usar el mismo panel aumentado en un 20%
-        panel_width = 600  # Antes 500
-        panel_height = 480  # Antes 400
-        panel_x = (WINDOW_WIDTH - panel_width) // 2
-        panel_y = (WINDOW_HEIGHT - panel_height) // 2
-
-        # Aumentar el ancho y la altura de los objetivos en un 20%
-        target_width = 216  # Antes 180 (180 * 1.2 = 216)
-        target_height = 48  # Antes 40 (40 * 1.2 = 48)
-
         # Ajustar la posición para mantener el centrado
-        target_x = panel_x + panel_width - target_width - 30  # Ajustado para centrar mejor
+        target_x = PMBOK_PANEL_X + PMBOK_PANEL_WIDTH - PMBOK_TARGET_WIDTH - 30  # Ajustado para centrar mejor
 
         # Alinear los objetivos con los elementos
-        item_height = 96  # Debe coincidir con el nuevo item_height
-        spacing = 30  # Debe coincidir con el nuevo spacing
-        target_y = panel_y + 115 + index * (item_height + spacing)
+        target_y = PMBOK_PANEL_Y + 115 + index * (PMBOK_ITEM_HEIGHT + PMBOK_ROW_SPACING)
 
-        return pygame.Rect(target_x, target_y, target_width, target_height)
+        return pygame.Rect(target_x, target_y, PMBOK_TARGET_WIDTH, PMBOK_TARGET_HEIGHT)
 
 
 class PMBOKInitiationRoom(Room):
@@ -671,6 +687,10 @@ class PMBOKInitiationRoom(Room):
         self.player_in_transition_area = False  # Inicializar variable para el área de transición
         self.player_near_mission = False  # Inicializar variable para el área de la misión
 
+        # Área de la misión en coordenadas absolutas y su área de proximidad (se calculan una vez)
+        self.mission_rect_abs = self.mission_rect.move(self.bg_x_offset, self.bg_y_offset)
+        self.mission_proximity_rect = self.mission_rect_abs.inflate(100, 100)  # 100 píxeles más grande en cada dirección para facilitar la interacción
+
         # Definir las áreas de colisión especificadas
         self.collision_rects = [
             # Rectángulos donde el jugador no puede acceder
@@ -731,16 +751,9 @@ class PMBOKInitiationRoom(Room):
         # Importar pygame al inicio del método para evitar errores
         import pygame
 
-        # Convertir las coordenadas relativas a absolutas para el área de la misión
-        mission_rect_abs = pygame.Rect(
-            self.mission_rect.x + self.bg_x_offset,
-            self.mission_rect.y + self.bg_y_offset,
-            self.mission_rect.width,
-            self.mission_rect.height
-        )
-
-        # Crear un rectángulo más grande para detectar proximidad
-        proximity_rect = mission_rect_abs.inflate(100, 100)  # 100 píxeles más grande en cada dirección para facilitar la interacción
+        # Áreas precalculadas en _setup_room
+        mission_rect_abs = self.mission_rect_abs
+        proximity_rect = self.mission_proximity_rect
 
         # Verificar si el jugador está cerca del área de la misión
         near_mission = proximity_rect.colliderect(player_rect)
@@ -1288,11 +1301,45 @@ import pygame
 from settings import *
 from utils import draw_panel
 
+class UserStory:
+    """
+    Historia de usuario (tarjeta) de la actividad de priorización.
+    Usa __slots__ para que cada tarjeta sea ligera y el acceso a sus datos sea directo.
+    """
+    __slots__ = ("id", "title", "priority", "description", "rect", "dragging",
+                 "id_surf", "title_surf", "priority_surf", "desc_surfs", "text_layers", "card_surf")
+
+    def __init__(self, story_id, title, priority, description):
+        self.id = story_id
+        self.title = title
+        self.priority = priority
+        self.description = description
+        self.rect = None
+        self.dragging = False
+
+        # Textos pre-renderizados (se asignan en _prerender_items)
+        self.id_surf = None
+        self.title_surf = None
+        self.priority_surf = None
+        self.desc_surfs = []
+        self.text_layers = []
+        self.card_surf = None
+
 class ScrumPrioritizationActivity:
     def __init__(self, game_instance):
         self.game = game_instance
         self.active = False
         self.font = pygame.font.Font(None, 22)
+        # Fuentes de las tarjetas (se crean una sola vez, no en cada frame)
+        self.font_text = pygame.font.Font(None, 16)
+        self.font_label = pygame.font.Font(None, 18)
+        self.font_bold = pygame.font.Font(None, 16)
+        self.font_bold.set_bold(True)
+        # Fuentes de los modales de resultado y retroalimentación
+        self.font_success = pygame.font.Font(None, 28)
+        self.font_feedback = pygame.font.Font(None, 20)
+        # Líneas ya envueltas por (texto, fuente, ancho máximo)
+        self.wrap_cache = {}
         self.result_message = ""
         self.result_color = GREEN
         self.show_result = False
@@ -1303,80 +1350,152 @@ class ScrumPrioritizationActivity:
 
         # Historias de usuario con prioridades (1 = más alta)
         self.items = [
-            {"id": 1, "text": "Guardar progreso automáticamente", "priority": 3, "rect": None, "dragging": False},
-            {"id": 2, "text": "Ver un tutorial inicial", "priority": 4, "rect": None, "dragging": False},
-            {"id": 3, "text": "Errores visuales animados", "priority": 1, "rect": None, "dragging": False},
-            {"id": 4, "text": "Tabla de puntuaciones", "priority": 2, "rect": None, "dragging": False},
-            {"id": 5, "text": "Pausar partida", "priority": 5, "rect": None, "dragging": False},
-        ]
-        self.items = [
-            {
-                "id": "H5",
-                "title": "Diseño del mapa y dinámicas de juego total",
-                "priority": 4,
-                "description": "Como paciente, quiero seleccionar especialidad, médico y fecha para agendar una cita desde la web sin llamar por teléfono.",
-                "rect": None,
-                "dragging": False
-            },
-            {
-                "id": "H4",
-                "title": "Diseño del mapa y dinámicas de juego total",
-                "priority": 2,
-                "description": "Como paciente, quiero recibir un correo si mi cita cambia, para estar informado en todo momento.",
-                "rect": None,
-                "dragging": False
-            },
-            {
-                "id": "H1",
-                "title": "Diseño del mapa y dinámicas de juego total",
-                "priority": 5,
-                "description": "Como paciente, quiero ver solo los médicos que atienden mi padecimiento, para elegir más fácilmente.",
-                "rect": None,
-                "dragging": False
-            },
-            {
-                "id": "H2",
-                "title": "Diseño del mapa y dinámicas de juego total",
-                "priority": 1,
-                "description": "Como paciente, quiero revisar todas las citas que he tenido, para llevar un mejor seguimiento de mi salud.",
-                "rect": None,
-                "dragging": False
-            },
-            {
-                "id": "H3",
-                "title": "Diseño del mapa y dinámicas de juego total",
-                "priority": 3,
-                "description": "Como administrador, quiero cambiar la paleta de colores del sitio para que combine con el logotipo del consultorio.",
-                "rect": None,
-                "dragging": False
-            },
-            
+            UserStory(
+                "H5",
+                "Diseño del mapa y dinámicas de juego total",
+                4,
+                "Como paciente, quiero seleccionar especialidad, médico y fecha para agendar una cita desde la web sin llamar por teléfono."
+            ),
+            UserStory(
+                "H4",
+                "Diseño del mapa y dinámicas de juego total",
+                2,
+                "Como paciente, quiero recibir un correo si mi cita cambia, para estar informado en todo momento."
+            ),
+            UserStory(
+                "H1",
+                "Diseño del mapa y dinámicas de juego total",
+                5,
+                "Como paciente, quiero ver solo los médicos que atienden mi padecimiento, para elegir más fácilmente."
+            ),
+            UserStory(
+                "H2",
+                "Diseño del mapa y dinámicas de juego total",
+                1,
+                "Como paciente, quiero revisar todas las citas que he tenido, para llevar un mejor seguimiento de mi salud."
+            ),
+            UserStory(
+                "H3",
+                "Diseño del mapa y dinámicas de juego total",
+                3,
+                "Como administrador, quiero cambiar la paleta de colores del sitio para que combine con el logotipo del consultorio."
+            ),
         ]
 
+        # Orden correcto de los IDs según la prioridad (se calcula una sola vez)
+        self.orden_correcto = [item.id for item in sorted(self.items, key=lambda x: x.priority)]
+
         # Posición inicial de las tarjetas
         self.panel_top = 90
         self.panel_left = WINDOW_WIDTH // 2 - 200
         #self.item_height = 160
         self.spacing = 5
         self.drag_offset_y = 0
+        self.dragging_item = None  # Tarjeta que se está arrastrando (o None)
+        self.frozen_background = None  # Captura del tablero mientras hay un modal encima
+        self.card_width = 550
 
+        self._prerender_items()
         self._position_items()
+        self._build_panel_surface()
+
+        # Botón de cerrar del panel (esquina superior derecha)
+        self.manual_close_rect = pygame.Rect(self.panel_rect.right - 100, self.panel_rect.y + 1, 90, 30)
+
+        # Botón de cerrar del modal de resultado (modal de 500x160 centrado)
+        modal_x = (WINDOW_WIDTH - 500) // 2
+        modal_y = (WINDOW_HEIGHT - 160) // 2
+        self.result_button_rect = pygame.Rect(modal_x + (500 - 100) // 2, modal_y + 160 - 40 - 15, 100, 40)
+
+    def _build_panel_surface(self):
+        """Construir una sola vez el panel estático (fondo, borde y título)"""
+        panel_width = 580
+        panel_padding = 30  # margen interno del panel
+
+        # Calcular altura total de las tarjetas (no cambia al reordenarlas)
+        total_height = sum(item.rect.height for item in self.items) + self.spacing * (len(self.items) - 1)
+
+        # Posición centrada y alto dinámico
+        panel_x = (WINDOW_WIDTH - panel_width) // 2
+        panel_y = self.panel_top - panel_padding
+        panel_height = total_height + 2 * panel_padding
+        self.panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
+
+        # Panel tipo pizarrón (verde tiza)
+        panel_color = (30, 60, 30)  # Verde oscuro pizarrón
+        border_color = (220, 220, 220)  # Borde blanco tipo tiza
+
+        self.panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+        pygame.draw.rect(self.panel_surface, panel_color, (0, 0, panel_width, panel_height), border_radius=15)
+        pygame.draw.rect(self.panel_surface, border_color, (0, 0, panel_width, panel_height), 2, border_radius=15)
+
+        title_surface = self.font.render("Ordena las historias de usuario por prioridad", True, WHITE)
+        title_rect = title_surface.get_rect(center=(panel_width // 2, 10))  # Y aquí va el ajuste vertical
+        self.panel_surface.blit(title_surface, title_rect)
+
+    def _prerender_items(self):
+        """Pre-renderizar los textos de cada tarjeta una sola vez"""
+        text_color = (40, 40, 40)
+        self.desc_label_surf = self.font_bold.render("Descripción", True, text_color)
+
+        for item in self.items:
+            item.id_surf = self.font_bold.render(f"ID {item.id}", True, text_color)
+            item.title_surf = self.font_label.render(f"Título: {item.title}", True, text_color)
+            item.priority_surf = self.font_bold.render(f"Prioridad: {item.priority}", True, text_color)
+            item.desc_surfs = [
+                self.font_text.render(line, True, text_color)
+                for line in self._wrap_text(item.description, self.font_text, self.card_width - 20)
+            ]
+
+            # Lista plana de (superficie, desplazamiento) relativa a la esquina de la tarjeta
+            item.text_layers = [
+                (item.id_surf, (10, 8)),
+                (item.title_surf, (110, 8)),
+                (item.priority_surf, (430, 8)),
+                (self.desc_label_surf, (10, 38)),
+            ] + [(line_surf, (10, 53 + i * 15)) for i, line_surf in enumerate(item.desc_surfs)]
+
+            item.card_surf = self._build_card_surface(item)
+
+    def _build_card_surface(self, item):
+        """Componer la tarjeta completa (fondo, borde, línea y textos) en una superficie"""
+        # Calcular líneas necesarias: cabecera fija + líneas de descripción
+        cabecera_altura = 65
+        altura_por_linea = 18
+        height = cabecera_altura + len(item.desc_surfs) * altura_por_linea
+
+        # Fondo de ficha
+        card_color = (245, 240, 220)
+        border_color = (100, 80, 60)
+
+        card = pygame.Surface((self.card_width, height), pygame.SRCALPHA)
+        card_rect = card.get_rect()
+
+        # Dibujar fondo y borde
+        pygame.draw.rect(card, card_color, card_rect, border_radius=6)
+        pygame.draw.rect(card, border_color, card_rect, 2, border_radius=6)
+
+        # Línea de separación
+        pygame.draw.line(card, border_color, (10, 28), (self.card_width - 10, 28), 1)
+
+        # ID, Título, Prioridad y descripción
+        card.blits(item.text_layers, doreturn=False)
+        return card
 
     def _position_items(self):
-        card_width = 550
+        card_width = self.card_width
         x = (WINDOW_WIDTH - card_width) // 2  # 👈 Centrado horizontal
         y = self.panel_top
-        font_text = pygame.font.Font(None, 16)
 
         for item in self.items:
-           # Calcular líneas necesarias antes del render
-            lines = self._wrap_text(item["description"], font_text, card_width - 20)
-            cabecera_altura = 65
-            altura_por_linea = 18
-            height = cabecera_altura + len(lines) * altura_por_linea
+            # La altura ya se calculó al componer la tarjeta
+            height = item.card_surf.get_height()
 
-            # Asignar el rect con altura correcta
-            item["rect"] = pygame.Rect(x, y, card_width, height)
+            # Asignar el rect con altura correcta (reutilizando el existente si ya hay uno)
+            if item.rect is None:
+                item.rect = pygame.Rect(x, y, card_width, height)
+            else:
+                item.rect.update(x, y, card_width, height)
 
             # Avanzar para la siguiente tarjeta (espaciado uniforme)
             y += height + self.spacing  # ← aquí controlas el espacio entre tarjetas
@@ -1386,6 +1505,7 @@ class ScrumPrioritizationActivity:
         self.active = True
         self.completed = False
         self.show_result = False
+        self.frozen_background = None
         self._position_items()
 
     def deactivate(self):
@@ -1397,12 +1517,12 @@ class ScrumPrioritizationActivity:
         
         if not self.show_result and not self.feedback_active:
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                if hasattr(self, 'manual_close_rect') and self.manual_close_rect.collidepoint(event.pos):
+                if self.manual_close_rect.collidepoint(event.pos):
                     self.deactivate()
                     return
 
         
-        if self.show_result and hasattr(self, 'result_button_rect'):
+        if self.show_result:
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 if self.result_button_rect.collidepoint(event.pos):
                     self.show_result = False
@@ -1420,34 +1540,37 @@ class ScrumPrioritizationActivity:
 
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:
-                for item in self.items:
-                    if item["rect"].collidepoint(event.pos):
-                        item["dragging"] = True
-                        self.drag_offset_y = event.pos[1] - item["rect"].y
+                # Una sola prueba de colisión contra todas las tarjetas
+                index = pygame.Rect(event.pos, (1, 1)).collidelist([item.rect for item in self.items])
+                if index != -1:
+                    item = self.items[index]
+                    item.dragging = True
+                    self.dragging_item = item
+                    self.drag_offset_y = event.pos[1] - item.rect.y
 
         elif event.type == pygame.MOUSEBUTTONUP:
             if event.button == 1:
                 for item in self.items:
-                    item["dragging"] = False
+                    item.dragging = False
+                self.dragging_item = None
                 self._reorder_items()
 
         elif event.type == pygame.MOUSEMOTION:
-            for item in self.items:
-                if item["dragging"]:
-                    item["rect"].y = event.pos[1] - self.drag_offset_y
+            # Solo mover la tarjeta arrastrada, sin recorrer toda la lista
+            if self.dragging_item is not None:
+                self.dragging_item.rect.y = event.pos[1] - self.drag_offset_y
 
         elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_RETURN:
                 self._verificar_orden()
 
     def _reorder_items(self):
-        self.items.sort(key=lambda item: item["rect"].y)
+        self.items.sort(key=lambda item: item.rect.y)
         self._position_items()
 
     def _verificar_orden(self):
-        orden_actual = [item["id"] for item in self.items]
-        orden_correcto = sorted(self.items, key=lambda x: x["priority"])
-        if orden_actual == [item["id"] for item in orden_correcto]:
+        orden_actual = [item.id for item in self.items]
+        if orden_actual == self.orden_correcto:
             self.completed = True
             self.result_message = "¡Orden correcto! Has priorizado correctamente las historias de usuario."
             self.result_color = GREEN
@@ -1469,83 +1592,29 @@ class ScrumPrioritizationActivity:
             self.feedback_active = True  # Mostrar el recuadro de error
             
 
+    def _render_board(self, screen):
+        """Dibujar el panel y las tarjetas de historias de usuario"""
+        # Panel tipo pizarrón pre-renderizado (fondo, borde y título)
+        screen.blit(self.panel_surface, self.panel_rect)
+
+        # Dibujar las tarjetas ya compuestas en una sola llamada
+        screen.blits([(item.card_surf, item.rect) for item in self.items], doreturn=False)
+
     def render(self, screen):
         if not self.active:
             return
 
-        panel_width = 580
-        panel_padding = 30  # margen interno del panel
-
-        # Calcular altura total de las tarjetas
-        total_height = sum(item["rect"].height for item in self.items) + self.spacing * (len(self.items) - 1)
-
-        # Posición centrada y alto dinámico
-        panel_x = (WINDOW_WIDTH - panel_width) // 2
-        panel_y = self.panel_top - panel_padding
-        panel_height = total_height + 2 * panel_padding
-
-        # Panel tipo pizarrón (verde tiza)
-        panel_color = (30, 60, 30)  # Verde oscuro pizarrón
-        border_color = (220, 220, 220)  # Borde blanco tipo tiza
-
-        pygame.draw.rect(screen, panel_color, (panel_x, panel_y, panel_width, panel_height), border_radius=15)
-        pygame.draw.rect(screen, border_color, (panel_x, panel_y, panel_width, panel_height), 2, border_radius=15)
-        
-
-        title_surface = self.font.render("Ordena las historias de usuario por prioridad", True, WHITE)
-        title_rect = title_surface.get_rect(center=(panel_x + panel_width // 2, panel_y + 10))  # Y aquí va el ajuste vertical
-        screen.blit(title_surface, title_rect)
-
-
-
-        # Dibujar las tarjetas
-        for item in self.items:
-
-            font_text = pygame.font.Font(None, 16)
-            # Ajustar la altura según cuántas líneas requiere la descripción
-            lines = self._wrap_text(item["description"], font_text, item["rect"].width - 20)
-            # Estimar altura: cabecera fija + líneas de descripción
-            cabecera_altura = 60
-            altura_por_linea = 18
-            #item["rect"].height = cabecera_altura + len(lines) * altura_por_linea
-
-            # Fondo de ficha
-            card_color = (245, 240, 220)
-            border_color = (100, 80, 60)
-            text_color = (40, 40, 40)
-
-            # Dibujar fondo y borde
-            pygame.draw.rect(screen, card_color, item["rect"], border_radius=6)
-            pygame.draw.rect(screen, border_color, item["rect"], 2, border_radius=6)
-
-            # Fuente para texto
-            font_label = pygame.font.Font(None, 18)
-            font_bold = pygame.font.Font(None, 16)
-            font_bold.set_bold(True)
-            
-
-            x = item["rect"].x + 10
-            y = item["rect"].y + 8
-
-            # Línea superior: ID, Título, Prioridad
-            id_text = font_bold.render(f"ID {item['id']}", True, text_color)
-            title_text = font_label.render(f"Título: {item['title']}", True, text_color)
-            priority_text = font_bold.render(f"Prioridad: {item['priority']}", True, text_color)
-
-            screen.blit(id_text, (x, y))
-            screen.blit(title_text, (x + 100, y))
-            screen.blit(priority_text, (x + 420, y))
-
-            # Línea de separación
-            pygame.draw.line(screen, border_color, (x, y + 20), (x + item["rect"].width - 20, y + 20), 1)
-
-            # Descripción (etiqueta)
-            screen.blit(font_bold.render("Descripción", True, text_color), (x, y + 30))
-
-            # Descripción (texto largo, envuelto)
-            desc_lines = self._wrap_text(item["description"], font_text, item["rect"].width - 20)
-            for i, line in enumerate(desc_lines):
-                screen.blit(font_text.render(line, True, text_color), (x, y + 45 + i * 15))
+        if self.show_result or self.feedback_active:
+            # El modal de resultado o de retroalimentación tapa el tablero:
+            # se dibuja una vez y se reutiliza la captura
+            if self.frozen_background is None:
+                self._render_board(screen)
+                self.frozen_background = screen.copy()
+            else:
+                screen.blit(self.frozen_background, (0, 0))
+        else:
+            self.frozen_background = None
+            self._render_board(screen)
 
         # Mostrar mensaje de resultado
         if self.show_result:
@@ -1563,16 +1632,15 @@ class ScrumPrioritizationActivity:
             pygame.draw.rect(screen, border_color, (modal_x, modal_y, modal_width, modal_height), 3, border_radius=16)
 
             # Texto del mensaje centrado
-            result_font = pygame.font.Font(None, 22)
+            result_font = self.font
             # Icono de éxito o título
             if self.completed:
-                success_font = pygame.font.Font(None, 28)
-                success_text = success_font.render(" ¡Éxito!", True, (20, 120, 40))
+                success_text = self.font_success.render(" ¡Éxito!", True, (20, 120, 40))
                 success_rect = success_text.get_rect(center=(modal_x + modal_width // 2, modal_y + 25))
                 screen.blit(success_text, success_rect)
 
             # Texto envuelto para que no se desborde
-            wrapped_lines = self._wrap_text(self.result_message, result_font, modal_width - 40)
+            wrapped_lines = self._get_wrapped_lines(self.result_message, result_font, modal_width - 40)
             for i, line in enumerate(wrapped_lines):
                 line_surface = result_font.render(line, True, self.result_color)
                 line_rect = line_surface.get_rect(center=(modal_x + modal_width // 2, modal_y + 70 + i * 25))
@@ -1580,12 +1648,6 @@ class ScrumPrioritizationActivity:
 
 
             # Botón de cerrar
-            btn_width = 100
-            btn_height = 40
-            btn_x = modal_x + (modal_width - btn_width) // 2
-            btn_y = modal_y + modal_height - btn_height - 15
-            self.result_button_rect = pygame.Rect(btn_x, btn_y, btn_width, btn_height)
-
             btn_color = (50, 120, 80)
             btn_border = (20, 60, 40)
 
@@ -1605,9 +1667,9 @@ class ScrumPrioritizationActivity:
             #screen.blit(btn_text, btn_text_rect)
         if self.feedback_active:
             modal_width = 500
-            font = pygame.font.Font(None, 20)
+            font = self.font_feedback
              # Ajustar altura dinámica según las líneas de retroalimentación
-            lines = self._wrap_text(self.result_message, font, modal_width - 40)
+            lines = self._get_wrapped_lines(self.result_message, font, modal_width - 40)
             line_height = 25
             modal_height = 80 + len(lines) * line_height
             
@@ -1618,7 +1680,6 @@ class ScrumPrioritizationActivity:
             pygame.draw.rect(screen, (180, 40, 40), (modal_x, modal_y, modal_width, modal_height), 3, border_radius=12)
 
             
-            lines = self._wrap_text(self.result_message, font, modal_width - 40)
             for i, line in enumerate(lines):
                 text_surf = font.render(line, True, (80, 20, 20))
                 text_rect = text_surf.get_rect(center=(modal_x + modal_width // 2, modal_y + 40 + i * 25))
@@ -1639,18 +1700,10 @@ class ScrumPrioritizationActivity:
             screen.blit(btn_text, btn_text_rect)
         # Mostrar botón de cerrar solo si no se está mostrando feedback ni resultado
         if not self.show_result and not self.feedback_active:
-            close_btn_width = 90
-            close_btn_height = 30
-            close_btn_x = panel_x + panel_width - 100
-            close_btn_y = panel_y + 1
-
-            self.manual_close_rect = pygame.Rect(close_btn_x, close_btn_y, close_btn_width, close_btn_height)
-
             pygame.draw.rect(screen, (100, 100, 100), self.manual_close_rect, border_radius=10)
             pygame.draw.rect(screen, WHITE, self.manual_close_rect, 2, border_radius=10)
 
-            close_font = pygame.font.Font(None, 20)
-            close_text = close_font.render("Cerrar", True, WHITE)
+            close_text = self.font_feedback.render("Cerrar", True, WHITE)
             close_text_rect = close_text.get_rect(center=self.manual_close_rect.center)
             screen.blit(close_text, close_text_rect)
 
@@ -1670,6 +1723,15 @@ class ScrumPrioritizationActivity:
             lines.append(" ".join(current))
         return lines
 
+    def _get_wrapped_lines(self, text, font, max_width):
+        """Obtener las líneas envueltas de un texto, calculándolas solo la primera vez"""
+        key = (text, font, max_width)
+        lines = self.wrap_cache.get(key)
+        if lines is None:
+            lines = self._wrap_text(text, font, max_width)
+            self.wrap_cache[key] = lines
+        return lines
+
     
 # Scrum Room Classes
 class ScrumRolesRoom(Room):
@@ -1713,6 +1775,7 @@ class ScrumRolesRoom(Room):
         self.info_rect = pygame.Rect(100, 400, 100, 100)
         self.player_near_info = False
         self.showing_info = False
+        self.info_font = pygame.font.Font(None, 22)  # Fuente del modal informativo
 
         # Variables para la animación de flotación
         self.animation_time = 0
@@ -1729,6 +1792,12 @@ class ScrumRolesRoom(Room):
         self.player_in_transition_area = False  # Inicializar variable para el área de transición
         self.player_near_mission = False  # Inicializar variable para el área de la misión
 
+        # Áreas de la misión y del objeto informativo en coordenadas absolutas,
+        # con sus áreas de proximidad (se calculan una vez)
+        self.mission_rect_abs = self.mission_rect.move(self.bg_x_offset, self.bg_y_offset)
+        self.mission_proximity_rect = self.mission_rect_abs.inflate(20, 20)
+        self.info_rect_abs = self.info_rect.move(self.bg_x_offset, self.bg_y_offset)
+        self.info_proximity_rect = self.info_rect_abs.inflate(20, 20)
 
         # Definir las áreas de colisión usando rectángulos
         # Las coordenadas son relativas a la imagen
@@ -1782,16 +1851,9 @@ class ScrumRolesRoom(Room):
         # Importar pygame al inicio del método para evitar errores
         import pygame
 
-        # Convertir las coordenadas relativas a absolutas para el área de la misión
-        mission_rect_abs = pygame.Rect(
-            self.mission_rect.x + self.bg_x_offset,
-            self.mission_rect.y + self.bg_y_offset,
-            self.mission_rect.width,
-            self.mission_rect.height
-        )
-
-        # Crear un rectángulo más grande para detectar proximidad
-        proximity_rect = mission_rect_abs.inflate(20, 20)  # 100 píxeles más grande en cada dirección para facilitar la interacción
+        # Áreas precalculadas en _setup_room
+        mission_rect_abs = self.mission_rect_abs
+        proximity_rect = self.mission_proximity_rect
 
         # Verificar si el jugador está cerca del área de la misión
         near_mission = proximity_rect.colliderect(player_rect)
@@ -1816,13 +1878,9 @@ class ScrumRolesRoom(Room):
         """Detecta si el jugador está cerca del segundo objeto interactivo"""
         import pygame 
     
-        info_rect_abs = pygame.Rect(
-            self.info_rect.x + self.bg_x_offset,
-            self.info_rect.y + self.bg_y_offset,
-            self.info_rect.width,
-            self.info_rect.height
-        )
-        proximity_rect = info_rect_abs.inflate(20, 20)
+        # Áreas precalculadas en _setup_room
+        info_rect_abs = self.info_rect_abs
+        proximity_rect = self.info_proximity_rect
 
         self.player_near_info = proximity_rect.colliderect(player_rect)
 
@@ -1958,7 +2016,7 @@ class ScrumRolesRoom(Room):
             pygame.draw.rect(screen, (240, 250, 255), (modal_x, modal_y, modal_width, modal_height), border_radius=12)
             pygame.draw.rect(screen, (30, 100, 160), (modal_x, modal_y, modal_width, modal_height), 3, border_radius=12)
 
-            font = pygame.font.Font(None, 22)
+            font = self.info_font
             # Texto largo que se adapta al ancho
             info_text = (
                 "¡Hola! Soy el Product Owner del proyecto ‘DocOnline’, una plataforma web para reservar citas médicas. Nuestro objetivo es lanzar una versión mínima funcional lo antes posible para que los pacientes puedan agendar y consultar sus citas desde casa. Todo lo que no afecte directamente esta experiencia puede esperar."
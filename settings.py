@@ -102,6 +102,10 @@ STATE_CREDITS = "credits"
 PATH_PMBOK = "pmbok"
 PATH_SCRUM = "scrum"
 
+# Path selection thresholds (player x position)
+PATH_SCRUM_X_MAX = WINDOW_WIDTH // 3  # Más a la izquierda elige Scrum
+PATH_PMBOK_X_MIN = (WINDOW_WIDTH * 2) // 3  # Más a la derecha elige PMBOK
+
 # Asset paths
 ASSETS_DIR = "assets"
 IMAGES_DIR = f"{ASSETS_DIR}/images"
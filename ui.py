@@ -83,8 +83,7 @@ class UI:
             timer: Timer object
             x, y: Position coordinates
         """
-        minutes = int(timer.get_time_left() // 60)
-        seconds = int(timer.get_time_left() % 60)
+        minutes, seconds = divmod(int(timer.get_time_left()), 60)
         timer_text = f"{minutes:02d}:{seconds:02d}"
 
         draw_text(
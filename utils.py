@@ -577,6 +577,34 @@ def draw_dashed_line(surface, color, start_pos, end_pos, width=1, dash_length=10
 
         pygame.draw.line(surface, color, (dash_start_x, dash_start_y), (dash_end_x, dash_end_y), width)
 
+# Cache of vertical gradients keyed by (top_color, bottom_color, width, height)
+_gradient_cache = {}
+
+def vertical_gradient(top_color, bottom_color, width, height):
+    """
+    Get a surface filled with a vertical gradient.
+
+    The gradient is built by smoothscaling a 1x2 seed surface, so the
+    interpolation happens in C; results are cached per color and size.
+
+    Args:
+        top_color: Color at the top (r, g, b)
+        bottom_color: Color at the bottom (r, g, b)
+        width, height: Size of the gradient surface
+
+    Returns:
+        Pygame surface with the gradient
+    """
+    key = (top_color, bottom_color, width, height)
+    gradient = _gradient_cache.get(key)
+    if gradient is None:
+        seed = pygame.Surface((1, 2))
+        seed.set_at((0, 0), top_color)
+        seed.set_at((0, 1), bottom_color)
+        gradient = pygame.transform.smoothscale(seed, (width, height))
+        _gradient_cache[key] = gradient
+    return gradient
+
 def draw_stardew_button(surface, rect, text, font, text_color=WHITE, bg_color=SDV_BROWN,
                        border_color=SDV_LIGHT_BROWN, hover=False, active=False):
     """
@@ -601,11 +629,9 @@ def draw_stardew_button(surface, rect, text, font, text_color=WHITE, bg_color=SD
     elif active:
         bg_color = color_lerp(bg_color, BLACK, 0.2)
 
-    # Create a gradient effect
-    for i in range(h):
-        shade = 1.0 - (i / h) * 0.3  # Darker at bottom
-        current_color = color_lerp(bg_color, BLACK, 1.0 - shade)
-        pygame.draw.line(surface, current_color, (x, y + i), (x + w - 1, y + i))
+    # Create a gradient effect (darker at bottom)
+    bottom_color = color_lerp(bg_color, BLACK, 0.3)
+    surface.blit(vertical_gradient(bg_color, bottom_color, w, h), (x, y))
 
     # Draw border
     border_width = 2